@@ -1,34 +1,227 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List, Set
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, List, Set, Optional, Dict, Iterable, Iterator, Type, Callable, Deque
+from importlib.metadata import entry_points
+from report_cache import ReportCache
+from report_writers import RecordWriter, JsonlWriter, SarifWriter
+import argparse
+import hashlib
+import io
 import os
 import sys
+import time
+
+with open(__file__, 'rb') as _source:
+    CHECKER_VERSION = hashlib.sha256(_source.read()).hexdigest()[:16]
+
+READ_CHUNK_SIZE = 1024 * 1024
+ANALYZER_ENTRY_POINTS = 'custom_style_checker.analyzers'
+DEFAULT_ANALYZERS = ['structure', 'docstrings', 'types', 'naming']
+DOCSTRING_LABELS = {
+    'class_docstring': "Class",
+    'method_docstring': "Method",
+    'function_docstring': "Function"
+}
+RECORD_FIELDS = {
+    'import': 'imports',
+    'class': 'classes',
+    'function': 'functions',
+    'class_docstring': 'docstrings',
+    'method_docstring': 'docstrings',
+    'function_docstring': 'docstrings',
+    'missing_docstring': 'docstrings',
+    'missing_types': 'missing_types',
+    'bad_camelcase': 'bad_camelcase',
+    'bad_snakecase': 'bad_snakecase'
+}
+WARNING_RULES = {
+    'missing_docstring': "Class, function or method has no docstring",
+    'missing_types': "Function or method is missing type annotations",
+    'bad_camelcase': "Class name does not follow CamelCase",
+    'bad_snakecase': "Function or method name does not follow snake_case"
+}
+
+def count_lines(chunks: Iterable[bytes]) -> int:
+    count, last = 0, b''
+    for chunk in chunks:
+        count += chunk.count(b'\n') + chunk.count(b'\r') - chunk.count(b'\r\n')
+        if last == b'\r' and chunk[:1] == b'\n':
+            count -= 1
+        last = chunk[-1:]
+    return count + (last not in (b'', b'\r', b'\n'))
 
 @dataclass
 class CodeFile:
     filepath: str
-    lines: List[str] = None
+    _lines: List[str] = field(default=None, repr=False)
+    digest: str = None
+    streaming: bool = False
+    line_count: int = None
+    data: bytes = None
+
+    @property
+    def lines(self) -> List[str]:
+        return self.load_lines()
+
+    @lines.setter
+    def lines(self, value: List[str]) -> None:
+        self._lines = value
 
     def read_file(self) -> None:
+        digest = hashlib.sha256()
+        if self.streaming:
+            def chunks(file):
+                for chunk in iter(lambda: file.read(READ_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+                    yield chunk
+
+            with open(self.filepath, 'rb') as file:
+                self.line_count = count_lines(chunks(file))
+            self.digest = digest.hexdigest()
+            return
+
+        with open(self.filepath, 'rb') as file:
+            self.data = file.read()
+        digest.update(self.data)
+        self.digest = digest.hexdigest()
+        self.line_count = count_lines([self.data])
+
+    def load_lines(self) -> List[str]:
+        if self._lines is None:
+            if self.data is not None:
+                self._lines = io.TextIOWrapper(io.BytesIO(self.data)).readlines()
+                self.data = None
+            else:
+                with open(self.filepath, 'r') as file:
+                    self._lines = file.readlines()
+        return self._lines
+
+    def iter_lines(self) -> Iterator[str]:
+        if self._lines is not None or not self.streaming:
+            yield from self.load_lines()
+            return
         with open(self.filepath, 'r') as file:
-            self.lines = file.readlines()
+            yield from file
+
+@dataclass
+class Finding:
+    path: str
+    analyzer: str
+    kind: str
+    name: str
+    detail: str = None
+
+    @property
+    def level(self) -> str:
+        return 'warning' if self.kind in WARNING_RULES else 'note'
+
+    @property
+    def message(self) -> str:
+        if self.kind in DOCSTRING_LABELS:
+            return f"{DOCSTRING_LABELS[self.kind]} {self.name} has a docstring"
+        return {
+            'import': f"Imports {self.name}",
+            'class': f"Defines class {self.name}",
+            'function': f"Defines standalone function {self.name}",
+            'missing_docstring': f"{self.name}: DocString not found.",
+            'missing_types': f"{self.name} is missing type annotations",
+            'bad_camelcase': f"Class {self.name} does not follow CamelCase convention",
+            'bad_snakecase': f"{self.name} does not follow snake_case convention"
+        }[self.kind]
+
+    def to_dict(self) -> Dict[str, str]:
+        return {
+            'path': self.path,
+            'analyzer': self.analyzer,
+            'kind': self.kind,
+            'name': self.name,
+            'level': self.level,
+            'message': self.message,
+            'detail': self.detail
+        }
+
+    def render(self) -> str:
+        if self.kind == 'missing_docstring':
+            return f"\n{self.name}: DocString not found."
+        if self.kind in DOCSTRING_LABELS:
+            return f"\n{DOCSTRING_LABELS[self.kind]} {self.name} docstring:\n{self.detail}"
+        return f"- {self.name}"
+
+@dataclass
+class PendingDocstring:
+    kind: str
+    name: str
+    collected: List[str] = None
+    finding: Finding = None
 
 class Analyzer(ABC):
     @abstractmethod
     def analyze(self, code_file: CodeFile) -> str:
         pass
 
+    def findings(self, code_file: CodeFile) -> Iterator[Finding]:
+        return iter(())
+
+def render_section(title: str, findings: Iterable[Finding], headers: Dict[str, str],
+                   fallback: str = None) -> str:
+    report = [title, "-" * 50]
+    kind = None
+
+    for finding in findings:
+        if finding.kind != kind:
+            kind = finding.kind
+            if kind in headers:
+                report.append(headers[kind])
+        report.append(finding.render())
+
+    if kind is None and fallback:
+        report.append(fallback)
+    return '\n'.join(report)
+
+_registry: Dict[str, Type[Analyzer]] = {}
+
+def register_analyzer(name: str) -> Callable[[Type[Analyzer]], Type[Analyzer]]:
+    def decorator(cls: Type[Analyzer]) -> Type[Analyzer]:
+        _registry[name] = cls
+        return cls
+    return decorator
+
+def load_analyzer(name: str) -> Type[Analyzer]:
+    if name not in _registry:
+        found = entry_points(group=ANALYZER_ENTRY_POINTS, name=name)
+        if not found:
+            raise ValueError(f"Unknown analyzer: {name}")
+        _registry[name] = next(iter(found)).load()
+    return _registry[name]
+
+def select_analyzers(enable: Iterable[str] = (), disable: Iterable[str] = ()) -> List[str]:
+    names = [name for name in DEFAULT_ANALYZERS if name not in disable]
+    return names + [name for name in enable if name not in names and name not in disable]
+
+@register_analyzer('structure')
 class FileStructure(Analyzer):
+    HEADERS = {
+        'import': "\nImported packages:",
+        'class': "\nClasses defined:",
+        'function': "\nStandalone functions:"
+    }
+
     def __init__(self):
         self._imports: Set[str] = set()
         self._classes: Set[str] = set()
         self._functions: Set[str] = set()
 
     def analyze(self, code_file: CodeFile) -> str:
-        self._find_elements(code_file.lines)
-        return self._generate_report()
+        return render_section("FILE STRUCTURE", self.findings(code_file), self.HEADERS)
+
+    def findings(self, code_file: CodeFile) -> Iterator[Finding]:
+        self._find_elements(code_file.iter_lines())
+        for kind, names in (('import', self._imports), ('class', self._classes), ('function', self._functions)):
+            for name in sorted(names):
+                yield Finding(code_file.filepath, 'structure', kind, name)
 
-    def _find_elements(self, lines: List[str]) -> None:
+    def _find_elements(self, lines: Iterable[str]) -> None:
         indent_level = 0
         in_class = False
         
@@ -52,32 +245,25 @@ class FileStructure(Analyzer):
                 func_name = stripped.split('def ')[1].split('(')[0]
                 self._functions.add(func_name)
 
-    def _generate_report(self) -> str:
-        report = ["FILE STRUCTURE", "-" * 50]
-        
-        if self._imports:
-            report.extend(["\nImported packages:"] + 
-                        [f"- {imp}" for imp in sorted(self._imports)])
-        
-        if self._classes:
-            report.extend(["\nClasses defined:"] + 
-                        [f"- {cls}" for cls in sorted(self._classes)])
-        
-        if self._functions:
-            report.extend(["\nStandalone functions:"] + 
-                        [f"- {func}" for func in sorted(self._functions)])
-            
-        return '\n'.join(report)
-
+@register_analyzer('docstrings')
 class DocStringAnalyzer(Analyzer):
     def analyze(self, code_file: CodeFile) -> str:
-        report = ["\nDOCSTRING ANALYSIS", "-" * 50]
+        return render_section("\nDOCSTRING ANALYSIS", self.findings(code_file), {})
+
+    def findings(self, code_file: CodeFile) -> Iterator[Finding]:
+        self._path = code_file.filepath
+        self._scanning: Optional[PendingDocstring] = None
+        self._collecting: Optional[PendingDocstring] = None
+        queue: Deque[PendingDocstring] = deque()
         indent_level = 0
         in_class = False
         current_class = ""
 
-        for i, line in enumerate(code_file.lines):
+        for line in code_file.iter_lines():
             stripped = line.strip()
+            self._advance(line, stripped)
+            while queue and queue[0].finding is not None:
+                yield queue.popleft().finding
             if not stripped:
                 continue
 
@@ -89,51 +275,68 @@ class DocStringAnalyzer(Analyzer):
                 current_class = stripped.split('class ')[1].split('(')[0].strip(':')
                 in_class = True
                 indent_level = current_indent
-                doc = self._get_docstring(code_file.lines, i + 1)
-                report.append(f"\nClass {current_class} docstring:" if doc 
-                            else f"\n{current_class}: DocString not found.")
-                if doc:
-                    report.append(doc)
+                self._scanning = PendingDocstring('class_docstring', current_class)
+                queue.append(self._scanning)
             
             elif stripped.startswith('def '):
                 func_name = stripped.split('def ')[1].split('(')[0]
                 full_name = f"{current_class}.{func_name}" if in_class else func_name
-                doc = self._get_docstring(code_file.lines, i + 1)
-                report.append(f"\n{'Method' if in_class else 'Function'} {full_name} docstring:" 
-                            if doc else f"\n{full_name}: DocString not found.")
-                if doc:
-                    report.append(doc)
-
-        return '\n'.join(report)
-
-    def _get_docstring(self, lines: List[str], start: int) -> str:
-        i = start
-        while i < len(lines):
-            line = lines[i].strip()
+                kind = 'method_docstring' if in_class else 'function_docstring'
+                self._scanning = PendingDocstring(kind, full_name)
+                queue.append(self._scanning)
+
+        if self._collecting is not None:
+            self._resolve(self._collecting, ' '.join(self._collecting.collected))
+        if self._scanning is not None:
+            self._resolve(self._scanning, "")
+        for lookup in queue:
+            yield lookup.finding
+
+    def _advance(self, line: str, stripped: str) -> None:
+        # Every class/def line ends the previous scan, so at most one definition
+        # is looking for its docstring and one is collecting a multi-line body.
+        collecting = self._collecting
+        if collecting is not None:
             if '"""' in line:
-                if line.count('"""') == 2:
-                    return line.split('"""')[1].strip()
-                else:
-                    docstring = []
-                    i += 1
-                    while i < len(lines) and '"""' not in lines[i]:
-                        docstring.append(lines[i].strip())
-                        i += 1
-                    return ' '.join(docstring)
-            elif not line or line.startswith('def ') or line.startswith('class '):
-                break
-            i += 1
-        return ""
+                self._resolve(collecting, ' '.join(collecting.collected))
+                self._collecting = None
+            else:
+                collecting.collected.append(stripped)
+
+        scanning = self._scanning
+        if scanning is None:
+            return
+        if '"""' in stripped:
+            if stripped.count('"""') == 2:
+                self._resolve(scanning, stripped.split('"""')[1].strip())
+            else:
+                scanning.collected = []
+                self._collecting = scanning
+            self._scanning = None
+        elif not stripped or stripped.startswith('def ') or stripped.startswith('class '):
+            self._resolve(scanning, "")
+            self._scanning = None
+
+    def _resolve(self, lookup: PendingDocstring, doc: str) -> None:
+        if doc:
+            lookup.finding = Finding(self._path, 'docstrings', lookup.kind, lookup.name, doc)
+        else:
+            lookup.finding = Finding(self._path, 'docstrings', 'missing_docstring', lookup.name)
 
+@register_analyzer('types')
 class TypeChecker(Analyzer):
     def analyze(self, code_file: CodeFile) -> str:
-        report = ["\nTYPE ANNOTATION CHECK", "-" * 50]
+        return render_section("\nTYPE ANNOTATION CHECK", self.findings(code_file),
+                              {'missing_types': "\nFunctions/methods missing type annotations:"},
+                              "\nAll functions and methods have type annotations.")
+
+    def findings(self, code_file: CodeFile) -> Iterator[Finding]:
         missing = []
         indent_level = 0
         in_class = False
         current_class = ""
 
-        for line in code_file.lines:
+        for line in code_file.iter_lines():
             stripped = line.strip()
             if not stripped:
                 continue
@@ -153,26 +356,30 @@ class TypeChecker(Analyzer):
                     name = f"{current_class}.{func_name}" if in_class else func_name
                     missing.append(name)
 
-        if missing:
-            report.extend(["\nFunctions/methods missing type annotations:"] +
-                        [f"- {name}" for name in sorted(missing)])
-        else:
-            report.append("\nAll functions and methods have type annotations.")
-
-        return '\n'.join(report)
+        for name in sorted(missing):
+            yield Finding(code_file.filepath, 'types', 'missing_types', name)
 
     def _has_type_annotations(self, func_def: str) -> bool:
         params = func_def.split('(')[1].split(')')[0]
         has_params = all(':' in p for p in params.split(',') if p.strip() and 'self' not in p)
         return '->' in func_def and has_params
 
+@register_analyzer('naming')
 class NamingChecker(Analyzer):
+    HEADERS = {
+        'bad_camelcase': "\nClasses not following CamelCase convention:",
+        'bad_snakecase': "\nFunctions/methods not following snake_case convention:"
+    }
+
     def analyze(self, code_file: CodeFile) -> str:
-        report = ["\nNAMING CONVENTION CHECK", "-" * 50]
+        return render_section("\nNAMING CONVENTION CHECK", self.findings(code_file), self.HEADERS,
+                              "\nAll names adhere to the specified naming conventions.")
+
+    def findings(self, code_file: CodeFile) -> Iterator[Finding]:
         bad_classes = []
         bad_functions = []
 
-        for line in code_file.lines:
+        for line in code_file.iter_lines():
             stripped = line.strip()
             if stripped.startswith('class '):
                 name = stripped.split('class ')[1].split('(')[0].strip(':')
@@ -183,18 +390,10 @@ class NamingChecker(Analyzer):
                 if not self._is_snake_case(name):
                     bad_functions.append(name)
 
-        if bad_classes:
-            report.extend(["\nClasses not following CamelCase convention:"] +
-                        [f"- {name}" for name in sorted(bad_classes)])
-
-        if bad_functions:
-            report.extend(["\nFunctions/methods not following snake_case convention:"] +
-                        [f"- {name}" for name in sorted(bad_functions)])
-
-        if not bad_classes and not bad_functions:
-            report.append("\nAll names adhere to the specified naming conventions.")
-
-        return '\n'.join(report)
+        for name in sorted(bad_classes):
+            yield Finding(code_file.filepath, 'naming', 'bad_camelcase', name)
+        for name in sorted(bad_functions):
+            yield Finding(code_file.filepath, 'naming', 'bad_snakecase', name)
 
     def _is_camel_case(self, name: str) -> bool:
         return name[0].isupper() and '_' not in name
@@ -203,28 +402,234 @@ class NamingChecker(Analyzer):
         return name.islower() and all(c.islower() or c.isdigit() or c == '_' for c in name)
 
 class StyleAnalyzer:
-    def __init__(self, filepath: str):
-        self.code_file = CodeFile(filepath)
+    def __init__(self, filepath: str, cache: Optional[ReportCache] = None, streaming: bool = False,
+                 analyzers: Optional[List[str]] = None):
+        self._analyzers: Dict[str, Analyzer] = {
+            name: load_analyzer(name)() for name in (analyzers or DEFAULT_ANALYZERS)
+        }
+        self.code_file = CodeFile(filepath, streaming=streaming)
+        self._cache = cache
         self.code_file.read_file()
-        self._analyzers: List[Analyzer] = [
-            FileStructure(),
-            DocStringAnalyzer(),
-            TypeChecker(),
-            NamingChecker()
-        ]
+        self.timings: Dict[str, float] = {}
 
-    def analyze(self) -> None:
-        reports = [analyzer.analyze(self.code_file) for analyzer in self._analyzers]
+    @property
+    def report_path(self) -> str:
         base_name = os.path.splitext(os.path.basename(self.code_file.filepath))[0]
-        report_path = os.path.join(os.path.dirname(self.code_file.filepath), f"style_report_{base_name}.txt")
-        with open(report_path, 'w') as file:
-            file.write('\n'.join(reports))
+        return os.path.join(os.path.dirname(self.code_file.filepath), f"style_report_{base_name}.txt")
+
+    def analyze(self) -> None:
+        self.write_report(self._iter_sections())
+
+    def sections(self) -> List[str]:
+        return list(self._iter_sections())
+
+    def write_report(self, sections: Iterable[str]) -> None:
+        with open(self.report_path, 'w') as file:
+            for i, section in enumerate(sections):
+                file.write(f"\n{section}" if i else section)
+
+    def findings(self) -> Iterator[Finding]:
+        for name, analyzer in self._analyzers.items():
+            start = time.perf_counter()
+            yield from analyzer.findings(self.code_file)
+            self.timings[name] = time.perf_counter() - start
+
+    def write_records(self, writer: RecordWriter, per_file: bool = False) -> None:
+        if per_file:
+            writer.write(self.to_dict())
+            return
+        for finding in self.findings():
+            writer.write(finding.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        fields: Dict[str, List[Any]] = {key: [] for key in RECORD_FIELDS.values()}
+        for finding in self.findings():
+            key = RECORD_FIELDS.get(finding.kind, finding.kind)
+            value = [finding.name, finding.detail] if key == 'docstrings' else finding.name
+            fields.setdefault(key, []).append(value)
+        record = {'path': self.code_file.filepath, 'total_lines': self.code_file.line_count}
+        for key, values in fields.items():
+            record[key] = values if key == 'docstrings' else sorted(values)
+        return record
+
+    def profile(self) -> str:
+        report = [f"{'analyzer':<12} {'seconds':>10} {'lines/s':>12}"]
+        for name in self._analyzers:
+            if name not in self.timings:
+                report.append(f"{name:<12} {'cached':>10}")
+                continue
+            seconds = self.timings[name]
+            rate = (self.code_file.line_count or 0) / seconds if seconds else float('inf')
+            report.append(f"{name:<12} {seconds:>10.4f} {rate:>12,.0f}")
+        return '\n'.join(report)
+
+    def _iter_sections(self) -> Iterator[str]:
+        key = None
+        cached = {}
+        if self._cache is not None:
+            key = self._cache.key(self.code_file.digest, CHECKER_VERSION)
+            cached = self._cache.get(key) or {}
+
+        fresh = {}
+        for name, analyzer in self._analyzers.items():
+            if name in cached:
+                yield cached[name]
+                continue
+            start = time.perf_counter()
+            section = analyzer.analyze(self.code_file)
+            self.timings[name] = time.perf_counter() - start
+            if type(analyzer).__module__ == __name__:
+                fresh[name] = section
+            yield section
+
+        if key is not None and fresh:
+            self._cache.put(key, {**cached, **fresh})
+
+class StyleWatcher:
+    def __init__(self, path: str, cache: Optional[ReportCache] = None, interval: float = 0.5,
+                 analyzers: Optional[List[str]] = None):
+        self.path = path
+        self.interval = interval
+        self._cache = cache
+        self._analyzer_names = analyzers
+        self._mtimes: Dict[str, int] = {}
+        self._digests: Dict[str, str] = {}
+        self._sections: Dict[str, List[str]] = {}
+
+    def watch(self) -> None:
+        while True:
+            for filepath, changed in self.poll().items():
+                print(f"{filepath}: updated {', '.join(changed)}")
+            time.sleep(self.interval)
+
+    def poll(self) -> Dict[str, List[str]]:
+        updates = {}
+        seen = set()
+        refreshed = False
+
+        for filepath in self._python_files():
+            try:
+                mtime = os.stat(filepath).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            seen.add(filepath)
+            if self._mtimes.get(filepath) == mtime:
+                continue
+            self._mtimes[filepath] = mtime
+            refreshed = True
+            changed = self._refresh(filepath)
+            if changed:
+                updates[filepath] = changed
+
+        for filepath in set(self._mtimes) - seen:
+            del self._mtimes[filepath]
+            self._digests.pop(filepath, None)
+            self._sections.pop(filepath, None)
+
+        if refreshed and self._cache is not None:
+            self._cache.prune()
+        return updates
+
+    def _python_files(self) -> List[str]:
+        if os.path.isfile(self.path):
+            return [self.path]
+        return [os.path.join(root, name)
+                for root, _, names in os.walk(self.path)
+                for name in names if name.endswith('.py')]
+
+    def _refresh(self, filepath: str) -> List[str]:
+        try:
+            analyzer = StyleAnalyzer(filepath, self._cache, analyzers=self._analyzer_names)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"{filepath}: {e}")
+            return []
+        if self._digests.get(filepath) == analyzer.code_file.digest:
+            return []
+
+        try:
+            sections = analyzer.sections()
+        except Exception as e:
+            print(f"{filepath}: analysis failed: {e}")
+            return []
+        self._digests[filepath] = analyzer.code_file.digest
+        previous = self._sections.get(filepath)
+        self._sections[filepath] = sections
+        if previous is None and self._read_report(analyzer.report_path) == '\n'.join(sections):
+            return []
+        if previous == sections:
+            return []
+
+        analyzer.write_report(sections)
+        if previous is None or len(previous) != len(sections):
+            return [self._section_title(section) for section in sections]
+        return [self._section_title(new) for old, new in zip(previous, sections) if old != new]
+
+    def _read_report(self, report_path: str) -> Optional[str]:
+        try:
+            with open(report_path, 'r') as file:
+                return file.read()
+        except OSError:
+            return None
+
+    def _section_title(self, section: str) -> str:
+        return section.strip().split('\n')[0]
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python style_checker.py <python_file>")
-        sys.exit(1)
-        
-    analyzer = StyleAnalyzer(sys.argv[1])
-    analyzer.analyze()
-    print("Style report generated")
\ No newline at end of file
+    parser = argparse.ArgumentParser(usage="python style_checker.py [options] <python_file>")
+    parser.add_argument('filepath')
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument('--stream', action='store_true',
+                        help="read the file line by line instead of loading it into memory")
+    parser.add_argument('--watch', action='store_true',
+                        help="keep running and re-check files under the path as they change")
+    parser.add_argument('--enable', action='append', default=[], metavar='NAME',
+                        help=f"run an extra analyzer from the '{ANALYZER_ENTRY_POINTS}' entry points")
+    parser.add_argument('--disable', action='append', default=[], metavar='NAME',
+                        help=f"skip an analyzer ({', '.join(DEFAULT_ANALYZERS)})")
+    parser.add_argument('--profile', action='store_true',
+                        help="print the time and lines per second of each analyzer")
+    parser.add_argument('--format', choices=['text', 'jsonl', 'sarif'], default='text',
+                        help="text writes style_report_<name>.txt; jsonl and sarif stream findings")
+    parser.add_argument('--per-file', action='store_true',
+                        help="with --format jsonl, write one record per file instead of per finding")
+    parser.add_argument('--output', default='-', metavar='PATH',
+                        help="where to write jsonl/sarif output (default: stdout)")
+    args = parser.parse_args()
+    cache = None if args.no_cache else ReportCache()
+    analyzers = select_analyzers(args.enable, args.disable)
+    try:
+        for name in analyzers:
+            load_analyzer(name)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.watch:
+        try:
+            StyleWatcher(args.filepath, cache, analyzers=analyzers).watch()
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
+    try:
+        analyzer = StyleAnalyzer(args.filepath, cache, streaming=args.stream, analyzers=analyzers)
+    except ValueError as e:
+        parser.error(str(e))
+
+    try:
+        if args.format != 'text':
+            stream = sys.stdout if args.output == '-' else open(args.output, 'w')
+            writer = (SarifWriter(stream, "custom_style_checker", WARNING_RULES) if args.format == 'sarif'
+                      else JsonlWriter(stream))
+            with writer:
+                analyzer.write_records(writer, per_file=args.per_file)
+            if stream is not sys.stdout:
+                stream.close()
+        else:
+            analyzer.analyze()
+            print("Style report generated")
+    except UnicodeDecodeError as e:
+        parser.error(f"{args.filepath}: {e}")
+    if cache is not None:
+        cache.prune()
+    if args.profile:
+        print(analyzer.profile(), file=sys.stderr if args.format != 'text' else sys.stdout)
\ No newline at end of file
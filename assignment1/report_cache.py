@@ -0,0 +1,64 @@
+from typing import Dict, Optional
+import hashlib
+import json
+import os
+
+class ReportCache:
+    def __init__(self, directory: str = None, max_bytes: int = 64 * 1024 * 1024):
+        self.directory = directory or os.path.join(os.path.expanduser('~'), '.cache', 'custom_style_checker')
+        self.max_bytes = max_bytes
+
+    def key(self, digest: str, version: str) -> str:
+        return hashlib.sha256(f"{version}:{digest}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        path = self._path(key)
+        try:
+            with open(path, 'r') as file:
+                reports = json.load(file)
+            os.utime(path)
+            return reports
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, reports: Dict[str, str]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = os.path.join(self.directory, f"{key}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as file:
+            json.dump(reports, file)
+        os.replace(tmp_path, self._path(key))
+
+    def clear(self) -> None:
+        for entry in self._entries():
+            self._remove(entry.path)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _entries(self):
+        try:
+            return [entry for entry in os.scandir(self.directory) if entry.name.endswith('.json')]
+        except FileNotFoundError:
+            return []
+
+    def prune(self) -> None:
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
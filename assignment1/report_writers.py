@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, TextIO
+import json
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+class RecordWriter(ABC):
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.count = 0
+
+    @abstractmethod
+    def write(self, record: Dict[str, Any]) -> None:
+        pass
+
+    def close(self) -> None:
+        self.stream.flush()
+
+    def __enter__(self) -> 'RecordWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class JsonlWriter(RecordWriter):
+    def write(self, record: Dict[str, Any]) -> None:
+        self.stream.write(json.dumps(record) + '\n')
+        self.count += 1
+
+class SarifWriter(RecordWriter):
+    def __init__(self, stream: TextIO, tool_name: str, rules: Dict[str, str]):
+        super().__init__(stream)
+        self._rules = rules
+        driver = {
+            'name': tool_name,
+            'rules': [{'id': rule, 'shortDescription': {'text': text}} for rule, text in rules.items()]
+        }
+        self.stream.write(f'{{"$schema": "{SARIF_SCHEMA}", "version": "2.1.0", '
+                          f'"runs": [{{"tool": {{"driver": {json.dumps(driver)}}}, "results": [')
+
+    def write(self, record: Dict[str, Any]) -> None:
+        if record.get('kind') not in self._rules:
+            return
+        result = {
+            'ruleId': record['kind'],
+            'level': record['level'],
+            'message': {'text': record['message']},
+            'locations': [{
+                'physicalLocation': {'artifactLocation': {'uri': record['path'].replace('\\', '/')}}
+            }]
+        }
+        self.stream.write((',\n' if self.count else '\n') + json.dumps(result))
+        self.count += 1
+
+    def close(self) -> None:
+        self.stream.write('\n]}]}\n')
+        super().close()
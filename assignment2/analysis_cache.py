@@ -0,0 +1,53 @@
+from typing import Optional, Dict, Any
+from pathlib import Path
+import hashlib
+import json
+import os
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'functional_style_checker'
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+def cache_key(data: bytes, version: str) -> str:
+    return hashlib.sha256(version.encode() + b'\0' + data).hexdigest()
+
+def load_entry(cache_dir: Path, key: str) -> Optional[Dict[str, Any]]:
+    path = cache_dir / f"{key}.json"
+    try:
+        with open(path, 'r') as f:
+            entry = json.load(f)
+        os.utime(path)
+        return entry
+    except (OSError, ValueError):
+        return None
+
+def store_entry(cache_dir: Path, key: str, entry: Dict[str, Any]) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = cache_dir / f"{key}.json"
+    tmp_path = cache_dir / f"{key}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(entry, f)
+    os.replace(tmp_path, path)
+
+def prune_cache(cache_dir: Path, max_bytes: int = MAX_CACHE_BYTES) -> int:
+    entries = []
+    for path in cache_dir.glob('*.json'):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed += 1
+
+    return removed
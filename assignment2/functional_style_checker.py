@@ -1,8 +1,48 @@
-from typing import List, Set, Tuple, Dict, Optional
+from typing import List, Set, Tuple, Dict, Optional, Iterable, Iterator, Any, TextIO
 from dataclasses import dataclass
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from analysis_cache import DEFAULT_CACHE_DIR, cache_key, load_entry, store_entry, prune_cache
+from output_formats import write_jsonl, write_sarif
+import argparse
+import hashlib
+import os
 import sys
 
+CHUNK_BYTES = 256 * 1024
+READ_CHUNK_SIZE = 1024 * 1024
+
+SECTION_TITLES = {
+    'structure': "FILE STRUCTURE",
+    'docstrings': "\nDOCSTRING ANALYSIS",
+    'types': "\nTYPE ANNOTATION CHECK",
+    'naming': "\nNAMING CONVENTION CHECK"
+}
+KIND_HEADERS = {
+    'import': "\nImported packages:",
+    'class': "\nClasses defined:",
+    'function': "\nStandalone functions:",
+    'missing_types': "\nFunctions/methods missing type annotations:",
+    'bad_camelcase': "\nClasses not following CamelCase convention:",
+    'bad_snakecase': "\nFunctions/methods not following snake_case convention:"
+}
+SECTION_FALLBACKS = {
+    'types': "\nAll functions and methods have type annotations.",
+    'naming': "\nAll names adhere to the specified naming conventions."
+}
+DOCSTRING_LABELS = {
+    'class_docstring': "Class",
+    'method_docstring': "Method",
+    'function_docstring': "Function"
+}
+WARNING_RULES = {
+    'missing_docstring': "Class, function or method has no docstring",
+    'missing_types': "Function or method is missing type annotations",
+    'bad_camelcase': "Class name does not follow CamelCase",
+    'bad_snakecase': "Function or method name does not follow snake_case"
+}
+CHECKER_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
 @dataclass(frozen=True)
 class CodeAnalysis:
     total_lines: int
@@ -14,71 +54,109 @@ class CodeAnalysis:
     bad_camelcase: frozenset[str]
     bad_snakecase: frozenset[str]
 
-def read_file(filepath: str) -> List[str]:
+@dataclass(frozen=True)
+class Finding:
+    path: str
+    check: str
+    kind: str
+    name: str
+    detail: Optional[str] = None
+
+def iter_file(filepath: str) -> Iterator[str]:
     with open(filepath, 'r') as f:
-        return f.readlines()
+        yield from f
 
-def analyze_imports(lines: List[str]) -> frozenset[str]:
-    return frozenset(
-        line.split()[1] for line in lines 
-        if line.strip().startswith(('import ', 'from '))
+def hash_file(filepath: str) -> bytes:
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+def analysis_to_dict(analysis: CodeAnalysis) -> Dict[str, Any]:
+    return {
+        'total_lines': analysis.total_lines,
+        'imports': sorted(analysis.imports),
+        'classes': sorted(analysis.classes),
+        'functions': sorted(analysis.functions),
+        'docstrings': list(analysis.docstrings.items()),
+        'missing_types': sorted(analysis.missing_types),
+        'bad_camelcase': sorted(analysis.bad_camelcase),
+        'bad_snakecase': sorted(analysis.bad_snakecase)
+    }
+
+def analysis_from_dict(entry: Dict[str, Any]) -> CodeAnalysis:
+    return CodeAnalysis(
+        total_lines=entry['total_lines'],
+        imports=frozenset(entry['imports']),
+        classes=frozenset(entry['classes']),
+        functions=frozenset(entry['functions']),
+        docstrings=dict(entry['docstrings']),
+        missing_types=frozenset(entry['missing_types']),
+        bad_camelcase=frozenset(entry['bad_camelcase']),
+        bad_snakecase=frozenset(entry['bad_snakecase'])
     )
 
-def find_definitions(lines: List[str]) -> Tuple[frozenset[str], frozenset[str]]:
-    classes: Set[str] = set()
-    functions: Set[str] = set()
-    
-    indent_stack = [0]
-    in_class = False
+@dataclass(frozen=True)
+class Definition:
+    kind: str
+    name: str
+    full_name: str
+    in_class: bool
+    line_index: int
+    signature: str
+    docstring: Optional[str]
+
+@dataclass(frozen=True)
+class SourceTable:
+    total_lines: int
+    imports: frozenset[str]
+    definitions: Tuple[Definition, ...]
+
+# Every class/def line ends the previous scan, so at most one definition is
+# looking for its docstring and one is collecting a multi-line body.
+DocstringState = Tuple[Optional[int], Optional[int], List[str]]
+
+def advance_docstrings(state: DocstringState, line: str, stripped: str,
+                       docstrings: List[Optional[str]]) -> DocstringState:
+    scanning, collecting, collected = state
     
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            continue
+    if collecting is not None:
+        if '"""' in line:
+            docstrings[collecting] = ' '.join(collected)
+            collecting, collected = None, []
+        else:
+            collected.append(stripped)
             
-        indent = len(line) - len(line.lstrip())
-        
-        while indent < indent_stack[-1]:
-            indent_stack.pop()
-            if len(indent_stack) == 1:
-                in_class = False
-                
-        if stripped.startswith('class '):
-            class_name = stripped.split('class ')[1].split('(')[0].strip(':')
-            classes.add(class_name)
-            in_class = True
-            indent_stack.append(indent)
+    if scanning is not None:
+        if '"""' in stripped:
+            if stripped.count('"""') == 2:
+                docstrings[scanning] = stripped.split('"""')[1].strip()
+            else:
+                collecting, collected = scanning, []
+            scanning = None
             
-        elif stripped.startswith('def ') and not in_class:
-            func_name = stripped.split('def ')[1].split('(')[0]
-            functions.add(func_name)
+        elif not stripped or stripped.startswith(('def', 'class')):
+            docstrings[scanning] = None
+            scanning = None
             
-    return frozenset(classes), frozenset(functions)
+    return scanning, collecting, collected
 
-def extract_docstrings(lines: List[str]) -> Dict[str, Optional[str]]:
-    docstrings: Dict[str, Optional[str]] = {}
+def parse_source(lines: Iterable[str]) -> SourceTable:
+    imports: Set[str] = set()
+    found: List[Tuple[str, str, str, bool, int, str]] = []
+    docstrings: List[Optional[str]] = []
+    docstring_state: DocstringState = (None, None, [])
+    total_lines = 0
+    
     indent_stack = [0]
+    in_class = False
     current_class = ""
     
-    def get_docstring(start_idx: int) -> Optional[str]:
-        for i in range(start_idx, len(lines)):
-            line = lines[i].strip()
-            if '"""' in line:
-                if line.count('"""') == 2:
-                    return line.split('"""')[1].strip()
-                else:
-                    doc_lines = []
-                    i += 1
-                    while i < len(lines) and '"""' not in lines[i]:
-                        doc_lines.append(lines[i].strip())
-                        i += 1
-                    return ' '.join(doc_lines)
-            elif not line or line.startswith(('def', 'class')):
-                return None
-        return None
-
     for i, line in enumerate(lines):
+        total_lines += 1
         stripped = line.strip()
+        docstring_state = advance_docstrings(docstring_state, line, stripped, docstrings)
         if not stripped:
             continue
             
@@ -87,185 +165,317 @@ def extract_docstrings(lines: List[str]) -> Dict[str, Optional[str]]:
         while indent < indent_stack[-1]:
             indent_stack.pop()
             if len(indent_stack) == 1:
+                in_class = False
                 current_class = ""
                 
-        if stripped.startswith('class '):
+        if stripped.startswith(('import ', 'from ')):
+            imports.add(stripped.split()[1])
+            
+        elif stripped.startswith('class '):
             name = stripped.split('class ')[1].split('(')[0].strip(':')
             current_class = name
+            in_class = True
             indent_stack.append(indent)
-            docstrings[name] = get_docstring(i + 1)
+            docstring_state = (len(found), *docstring_state[1:])
+            found.append(('class', name, name, in_class, i, stripped))
+            docstrings.append(None)
             
         elif stripped.startswith('def '):
             name = stripped.split('def ')[1].split('(')[0]
             full_name = f"{current_class}.{name}" if current_class else name
-            docstrings[full_name] = get_docstring(i + 1)
+            docstring_state = (len(found), *docstring_state[1:])
+            found.append(('def', name, full_name, in_class, i, stripped))
+            docstrings.append(None)
             
-    return docstrings
+    _, collecting, collected = docstring_state
+    if collecting is not None:
+        docstrings[collecting] = ' '.join(collected)
+        
+    definitions = tuple(Definition(*fields, doc) for fields, doc in zip(found, docstrings))
+    return SourceTable(total_lines, frozenset(imports), definitions)
 
-def check_type_annotations(lines: List[str]) -> frozenset[str]:
-    missing: Set[str] = set()
-    indent_stack = [0]
-    current_class = ""
-    
+def analyze_imports(table: SourceTable) -> frozenset[str]:
+    return table.imports
+
+def find_definitions(table: SourceTable) -> Tuple[frozenset[str], frozenset[str]]:
+    classes = frozenset(d.name for d in table.definitions if d.kind == 'class')
+    functions = frozenset(
+        d.name for d in table.definitions 
+        if d.kind == 'def' and not d.in_class
+    )
+    return classes, functions
+
+def extract_docstrings(table: SourceTable) -> Dict[str, Optional[str]]:
+    return {d.full_name: d.docstring for d in table.definitions}
+
+def check_type_annotations(table: SourceTable) -> frozenset[str]:
     def lacks_annotations(func_def: str) -> bool:
         params = func_def.split('(')[1].split(')')[0]
         has_params = all(':' in p for p in params.split(',') 
                         if p.strip() and 'self' not in p)
         return '->' not in func_def or not has_params
     
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            continue
-            
-        indent = len(line) - len(line.lstrip())
-        
-        while indent < indent_stack[-1]:
-            indent_stack.pop()
-            if len(indent_stack) == 1:
-                current_class = ""
-                
-        if stripped.startswith('class '):
-            current_class = stripped.split('class ')[1].split('(')[0].strip(':')
-            indent_stack.append(indent)
-            
-        elif stripped.startswith('def '):
-            name = stripped.split('def ')[1].split('(')[0]
-            full_name = f"{current_class}.{name}" if current_class else name
-            if lacks_annotations(stripped):
-                missing.add(full_name)
-                
-    return frozenset(missing)
+    return frozenset(
+        d.full_name for d in table.definitions 
+        if d.kind == 'def' and lacks_annotations(d.signature)
+    )
 
-def check_naming_conventions(lines: List[str]) -> Tuple[frozenset[str], frozenset[str]]:
+def check_naming_conventions(table: SourceTable) -> Tuple[frozenset[str], frozenset[str]]:
     bad_camel: Set[str] = set()
     bad_snake: Set[str] = set()
     
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith('class '):
-            name = stripped.split('class ')[1].split('(')[0].strip(':')
+    for d in table.definitions:
+        name = d.name
+        if d.kind == 'class':
             if not (name[0].isupper() and '_' not in name):
                 bad_camel.add(name)
                 
-        elif stripped.startswith('def '):
-            name = stripped.split('def ')[1].split('(')[0]
-            if not (name.islower() and 
-                   all(c.islower() or c.isdigit() or c == '_' for c in name)):
-                bad_snake.add(name)
+        elif not (name.islower() and 
+                  all(c.islower() or c.isdigit() or c == '_' for c in name)):
+            bad_snake.add(name)
                 
     return frozenset(bad_camel), frozenset(bad_snake)
 
-def generate_report(analysis: CodeAnalysis) -> str:
-    sections = []
-    
-    sections.extend([
-        "FILE STRUCTURE",
-        "-" * 50,
-        f"\nTotal lines of code: {analysis.total_lines}"
-    ])
-    
-    if analysis.imports:
-        sections.extend([
-            "\nImported packages:",
-            *[f"- {imp}" for imp in sorted(analysis.imports)]
-        ])
-        
-    if analysis.classes:
-        sections.extend([
-            "\nClasses defined:",
-            *[f"- {cls}" for cls in sorted(analysis.classes)]
-        ])
-        
-    if analysis.functions:
-        sections.extend([
-            "\nStandalone functions:",
-            *[f"- {func}" for func in sorted(analysis.functions)]
-        ])
-    
-    sections.extend([
-        "\nDOCSTRING ANALYSIS",
-        "-" * 50
-    ])
+def iter_findings(analysis: CodeAnalysis, path: str = '') -> Iterator[Finding]:
+    yield Finding(path, 'structure', 'total_lines', '', str(analysis.total_lines))
+    yield from (Finding(path, 'structure', 'import', imp) for imp in sorted(analysis.imports))
+    yield from (Finding(path, 'structure', 'class', cls) for cls in sorted(analysis.classes))
+    yield from (Finding(path, 'structure', 'function', func) for func in sorted(analysis.functions))
     
     for name, docstring in sorted(analysis.docstrings.items()):
-        kind = "Class" if '.' not in name else "Method"
+        kind = 'class_docstring' if '.' not in name else 'method_docstring'
         if '.' not in name and not any(c in name for c in analysis.classes):
-            kind = "Function"
-            
+            kind = 'function_docstring'
         if docstring:
-            sections.extend([
-                f"\n{kind} {name} docstring:",
-                docstring
-            ])
+            yield Finding(path, 'docstrings', kind, name, docstring)
         else:
-            sections.append(f"\n{name}: DocString not found.")
-    
-    sections.extend([
-        "\nTYPE ANNOTATION CHECK",
-        "-" * 50
-    ])
-    
-    if analysis.missing_types:
-        sections.extend([
-            "\nFunctions/methods missing type annotations:",
-            *[f"- {name}" for name in sorted(analysis.missing_types)]
-        ])
-    else:
-        sections.append("\nAll functions and methods have type annotations.")
-    
-    sections.extend([
-        "\nNAMING CONVENTION CHECK",
-        "-" * 50
-    ])
+            yield Finding(path, 'docstrings', 'missing_docstring', name)
+            
+    yield from (Finding(path, 'types', 'missing_types', name) 
+                for name in sorted(analysis.missing_types))
+    yield from (Finding(path, 'naming', 'bad_camelcase', name) 
+                for name in sorted(analysis.bad_camelcase))
+    yield from (Finding(path, 'naming', 'bad_snakecase', name) 
+                for name in sorted(analysis.bad_snakecase))
+
+def finding_message(finding: Finding) -> str:
+    messages = {
+        'total_lines': f"{finding.detail} lines of code",
+        'import': f"Imports {finding.name}",
+        'class': f"Defines class {finding.name}",
+        'function': f"Defines function {finding.name}",
+        'missing_docstring': f"{finding.name}: DocString not found.",
+        'missing_types': f"{finding.name} is missing type annotations",
+        'bad_camelcase': f"Class {finding.name} does not follow CamelCase convention",
+        'bad_snakecase': f"{finding.name} does not follow snake_case convention"
+    }
+    if finding.kind in DOCSTRING_LABELS:
+        return f"{DOCSTRING_LABELS[finding.kind]} {finding.name} has a docstring"
+    return messages[finding.kind]
+
+def finding_to_dict(finding: Finding) -> Dict[str, Any]:
+    return {
+        'path': finding.path,
+        'check': finding.check,
+        'kind': finding.kind,
+        'name': finding.name,
+        'level': 'warning' if finding.kind in WARNING_RULES else 'note',
+        'message': finding_message(finding),
+        'detail': finding.detail
+    }
+
+def render_finding(finding: Finding) -> str:
+    if finding.kind == 'total_lines':
+        return f"\nTotal lines of code: {finding.detail}"
+    if finding.kind == 'missing_docstring':
+        return f"\n{finding.name}: DocString not found."
+    if finding.kind in DOCSTRING_LABELS:
+        return f"\n{DOCSTRING_LABELS[finding.kind]} {finding.name} docstring:\n{finding.detail}"
+    return f"- {finding.name}"
+
+def render_text(findings: Iterable[Finding]) -> Iterator[str]:
+    findings = iter(findings)
+    pending = next(findings, None)
     
-    if analysis.bad_camelcase:
-        sections.extend([
-            "\nClasses not following CamelCase convention:",
-            *[f"- {name}" for name in sorted(analysis.bad_camelcase)]
-        ])
-        
-    if analysis.bad_snakecase:
-        sections.extend([
-            "\nFunctions/methods not following snake_case convention:",
-            *[f"- {name}" for name in sorted(analysis.bad_snakecase)]
-        ])
+    for section, title in SECTION_TITLES.items():
+        yield title
+        yield "-" * 50
         
-    if not (analysis.bad_camelcase or analysis.bad_snakecase):
-        sections.append("\nAll names adhere to the specified naming conventions.")
-    
-    return '\n'.join(sections)
+        kind = None
+        while pending is not None and pending.check == section:
+            if pending.kind != kind:
+                kind = pending.kind
+                if kind in KIND_HEADERS:
+                    yield KIND_HEADERS[kind]
+            yield render_finding(pending)
+            pending = next(findings, None)
+            
+        if kind is None and section in SECTION_FALLBACKS:
+            yield SECTION_FALLBACKS[section]
 
-def analyze_code(filepath: str) -> CodeAnalysis:
-    lines = read_file(filepath)
-    classes, functions = find_definitions(lines)
-    bad_camel, bad_snake = check_naming_conventions(lines)
+def generate_report(analysis: CodeAnalysis) -> str:
+    return '\n'.join(render_text(iter_findings(analysis)))
+
+def analyze_lines(lines: Iterable[str]) -> CodeAnalysis:
+    table = parse_source(lines)
+    classes, functions = find_definitions(table)
+    bad_camel, bad_snake = check_naming_conventions(table)
     
     return CodeAnalysis(
-        total_lines=len(lines),
-        imports=analyze_imports(lines),
+        total_lines=table.total_lines,
+        imports=analyze_imports(table),
         classes=classes,
         functions=functions,
-        docstrings=extract_docstrings(lines),
-        missing_types=check_type_annotations(lines),
+        docstrings=extract_docstrings(table),
+        missing_types=check_type_annotations(table),
         bad_camelcase=bad_camel,
         bad_snakecase=bad_snake
     )
 
+def analyze_code(filepath: str, cache_dir: Optional[Path] = None) -> CodeAnalysis:
+    if cache_dir is None:
+        return analyze_lines(iter_file(filepath))
+        
+    key = cache_key(hash_file(filepath), CHECKER_VERSION)
+    entry = load_entry(cache_dir, key)
+    if entry is not None:
+        return analysis_from_dict(entry)
+        
+    analysis = analyze_lines(iter_file(filepath))
+    store_entry(cache_dir, key, analysis_to_dict(analysis))
+    return analysis
+
+def write_report(filepath: str, analysis: CodeAnalysis) -> Path:
+    output_path = Path(filepath).parent / f"style_report_{Path(filepath).stem}.txt"
+    with open(output_path, 'w') as f:
+        for i, line in enumerate(render_text(iter_findings(analysis, filepath))):
+            f.write(f"\n{line}" if i else line)
+    return output_path
+
+def iter_records(results: Iterable[Tuple[str, Optional[CodeAnalysis], Optional[str]]],
+                 per_file: bool, failures: List[str]) -> Iterator[Dict[str, Any]]:
+    for filepath, analysis, error in results:
+        if error is not None:
+            print(f"Error: {filepath}: {error}", file=sys.stderr)
+            failures.append(filepath)
+            yield {'path': filepath, 'error': error}
+        elif per_file:
+            yield {'path': filepath, **analysis_to_dict(analysis)}
+        else:
+            yield from (finding_to_dict(f) for f in iter_findings(analysis, filepath))
+
+def write_records(results: Iterable[Tuple[str, Optional[CodeAnalysis], Optional[str]]],
+                  output_format: str, per_file: bool, stream: TextIO) -> int:
+    failures: List[str] = []
+    records = iter_records(results, per_file, failures)
+    
+    if output_format == 'sarif':
+        write_sarif(stream, records, "functional_style_checker", WARNING_RULES)
+    else:
+        write_jsonl(stream, records)
+        
+    return len(failures)
+
+def find_python_files(root: str) -> List[Path]:
+    return sorted(p for p in Path(root).rglob('*.py') if p.is_file())
+
+def chunk_files(paths: Iterable[Path], max_bytes: int = CHUNK_BYTES) -> Iterator[List[str]]:
+    chunk: List[str] = []
+    size = 0
+    
+    for path in paths:
+        chunk.append(str(path))
+        size += path.stat().st_size
+        if size >= max_bytes:
+            yield chunk
+            chunk, size = [], 0
+            
+    if chunk:
+        yield chunk
+
+def analyze_chunk(filepaths: List[str], 
+                  cache_dir: Optional[Path] = None) -> List[Tuple[str, Optional[CodeAnalysis], Optional[str]]]:
+    results = []
+    for filepath in filepaths:
+        try:
+            results.append((filepath, analyze_code(filepath, cache_dir), None))
+        except Exception as e:
+            results.append((filepath, None, str(e)))
+    return results
+
+def iter_analyses(root: str, 
+                  cache_dir: Optional[Path] = None) -> Iterator[Tuple[str, Optional[CodeAnalysis], Optional[str]]]:
+    chunks = chunk_files(find_python_files(root))
+    
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(analyze_chunk, chunk, cache_dir) for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+            
+    if cache_dir is not None:
+        prune_cache(cache_dir)
+
+def analyze_tree(root: str, cache_dir: Optional[Path] = None) -> int:
+    failures = 0
+    
+    for filepath, analysis, error in iter_analyses(root, cache_dir):
+        if error is not None:
+            print(f"Error: {filepath}: {error}")
+            failures += 1
+        else:
+            print(f"Style report generated: {write_report(filepath, analysis)}")
+            
+    return failures
+
 def main() -> None:
-    if len(sys.argv) != 2:
+    parser = argparse.ArgumentParser(description="Functional Python style checker")
+    parser.add_argument('filepath', nargs='?', help="Python file to analyze")
+    parser.add_argument('--recursive', metavar='DIR',
+                        help="analyze every .py file under DIR in parallel")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="ignore and do not update the analysis cache")
+    parser.add_argument('--format', choices=['text', 'jsonl', 'sarif'], default='text',
+                        help="text writes style_report_<name>.txt files; jsonl and sarif stream findings")
+    parser.add_argument('--per-file', action='store_true',
+                        help="with --format jsonl, write one record per file instead of per finding")
+    parser.add_argument('--output', default='-', metavar='PATH',
+                        help="where to write jsonl/sarif output (default: stdout)")
+    args = parser.parse_args()
+    cache_dir = None if args.no_cache else DEFAULT_CACHE_DIR
+    if args.recursive and not os.path.isdir(args.recursive):
+        parser.error(f"--recursive: {args.recursive} is not a directory")
+    
+    if args.format != 'text':
+        if args.recursive:
+            results = iter_analyses(args.recursive, cache_dir)
+        else:
+            filepath = args.filepath or input("Enter the path to the Python file to analyze: ").strip()
+            results = iter(analyze_chunk([filepath], cache_dir))
+            
+        if args.output == '-':
+            failures = write_records(results, args.format, args.per_file, sys.stdout)
+        else:
+            with open(args.output, 'w') as stream:
+                failures = write_records(results, args.format, args.per_file, stream)
+        sys.exit(1 if failures else 0)
+        
+    if args.recursive:
+        failures = analyze_tree(args.recursive, cache_dir)
+        if failures:
+            print(f"{failures} file(s) could not be analyzed")
+            sys.exit(1)
+        print("Style reports generated successfully!")
+        return
+        
+    filepath = args.filepath
+    if filepath is None:
         filepath = input("Enter the path to the Python file to analyze: ").strip()
-    else:
-        filepath = sys.argv[1]
         
     try:
-        analysis = analyze_code(filepath)
-        report = generate_report(analysis)
-        
-        output_path = Path(filepath).parent / f"style_report_{Path(filepath).stem}.txt"
-        with open(output_path, 'w') as f:
-            f.write(report)
-            
+        analysis = analyze_code(filepath, cache_dir)
+        write_report(filepath, analysis)
+        if cache_dir is not None:
+            prune_cache(cache_dir)
         print("Style report generated successfully!")
         
     except Exception as e:
@@ -273,4 +483,4 @@ def main() -> None:
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,39 @@
+from typing import Any, Dict, Iterable, TextIO
+from pathlib import Path
+import json
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+def write_jsonl(stream: TextIO, records: Iterable[Dict[str, Any]]) -> int:
+    count = 0
+    for record in records:
+        stream.write(json.dumps(record) + '\n')
+        count += 1
+    return count
+
+def sarif_result(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'ruleId': record['kind'],
+        'level': record['level'],
+        'message': {'text': record['message']},
+        'locations': [{
+            'physicalLocation': {'artifactLocation': {'uri': Path(record['path']).as_posix()}}
+        }]
+    }
+
+def write_sarif(stream: TextIO, records: Iterable[Dict[str, Any]],
+                tool_name: str, rules: Dict[str, str]) -> int:
+    driver = {
+        'name': tool_name,
+        'rules': [{'id': rule, 'shortDescription': {'text': text}} for rule, text in rules.items()]
+    }
+    stream.write(f'{{"$schema": "{SARIF_SCHEMA}", "version": "2.1.0", '
+                 f'"runs": [{{"tool": {{"driver": {json.dumps(driver)}}}, "results": [')
+    count = 0
+    for record in records:
+        if record.get('kind') not in rules:
+            continue
+        stream.write((',\n' if count else '\n') + json.dumps(sarif_result(record)))
+        count += 1
+    stream.write('\n]}]}\n')
+    return count
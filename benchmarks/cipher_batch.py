@@ -0,0 +1,53 @@
+import argparse
+import os
+import random
+import string
+import sys
+import time
+from typing import Callable, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'lab10'))
+
+from cipher import encrypt, encrypt_many
+
+KEY = 7
+
+def make_messages(count: int, length: int) -> List[str]:
+    random.seed(0)
+    alphabet = string.ascii_letters + string.digits + string.punctuation + ' '
+    return [''.join(random.choices(alphabet, k=random.randint(length // 2, length * 3 // 2))) for _ in range(count)]
+
+def best_of(runs: int, fn: Callable[[], List[str]]) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare per-message encrypt() with encrypt_many()")
+    parser.add_argument('--messages', type=int, default=1_000_000)
+    parser.add_argument('--length', type=int, default=40, help="mean message length in characters")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    messages = make_messages(args.messages, args.length)
+    assert encrypt_many(messages, KEY) == [encrypt(m, KEY) for m in messages]
+
+    variants = {
+        'per-message loop': lambda: [encrypt(m, KEY) for m in messages],
+        'encrypt_many': lambda: encrypt_many(messages, KEY),
+        f'encrypt_many, {args.workers} workers': lambda: encrypt_many(messages, KEY, workers=args.workers),
+    }
+    baseline = None
+    print(f"{args.messages:,} messages, ~{args.length} chars each")
+    for name, fn in variants.items():
+        seconds = best_of(args.runs, fn)
+        baseline = baseline or seconds
+        print(f"  {name:<28} {seconds:.3f}s  {args.messages / seconds:>12,.0f} msg/s  {baseline / seconds:.1f}x")
+
+if __name__ == '__main__':
+    main()
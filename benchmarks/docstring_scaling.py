@@ -0,0 +1,67 @@
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, Dict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, 'assignment1'), os.path.join(ROOT, 'assignment2')]
+
+from custom_style_checker import CodeFile, DocStringAnalyzer
+from functional_style_checker import iter_file, parse_source
+
+SIZES = [25_000, 50_000, 100_000]
+
+def short_definitions(n: int) -> str:
+    return ''.join(f'def f_{i}(a: int) -> int:\n    """Doc {i}."""\n    return a\n' for i in range(n))
+
+def multiline_docstrings(n: int) -> str:
+    return ''.join(f'def f_{i}(a: int) -> int:\n    """\n    Doc {i}.\n    """\n    return a\n' for i in range(n))
+
+def unterminated_string(n: int) -> str:
+    return 'x = """\n' + ''.join(f'def f_{i}(a):\n    return a\n' for i in range(n))
+
+def quote_per_definition(n: int) -> str:
+    return ''.join(f'def f_{i}(a):\n    s = """\n' for i in range(n))
+
+SHAPES: Dict[str, Callable[[int], str]] = {
+    'short definitions': short_definitions,
+    'multi-line docstrings': multiline_docstrings,
+    'unterminated string': unterminated_string,
+    'quote per definition': quote_per_definition,
+}
+
+def time_oop(filepath: str) -> float:
+    code_file = CodeFile(filepath, streaming=True)
+    start = time.perf_counter()
+    DocStringAnalyzer().analyze(code_file)
+    return time.perf_counter() - start
+
+def time_functional(filepath: str) -> float:
+    start = time.perf_counter()
+    parse_source(iter_file(filepath))
+    return time.perf_counter() - start
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as tmp:
+        for shape, generate in SHAPES.items():
+            print(f"\n{shape}")
+            print(f"{'definitions':>12} {'assignment1':>14} {'assignment2':>14} {'us/def (a1/a2)':>18}")
+            baseline = None
+
+            for n in SIZES:
+                filepath = os.path.join(tmp, 'synthetic.py')
+                with open(filepath, 'w') as f:
+                    f.write(generate(n))
+
+                oop = min(time_oop(filepath) for _ in range(3))
+                functional = min(time_functional(filepath) for _ in range(3))
+                print(f"{n:>12} {oop:>13.3f}s {functional:>13.3f}s "
+                      f"{oop / n * 1e6:>8.2f} / {functional / n * 1e6:.2f}")
+                if baseline is None:
+                    baseline = (n, oop, functional)
+
+            n0, oop0, functional0 = baseline
+            scale = SIZES[-1] / n0
+            print(f"{scale:.0f}x definitions -> {oop / oop0:.1f}x time (assignment1), "
+                  f"{functional / functional0:.1f}x time (assignment2)")
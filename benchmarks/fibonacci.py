@@ -0,0 +1,72 @@
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'lab10'))
+
+from decorator import recur_fibo, memoized_fibo, fast_fibo
+
+def iter_fibo(n: int) -> int:
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+def uncached_memoized_fibo(n: int) -> int:
+    memoized_fibo.cache_clear()
+    return memoized_fibo(n)
+
+VARIANTS: Dict[str, Tuple[Callable[[int], int], int]] = {
+    'recursive': (recur_fibo, 30),
+    'memoized': (uncached_memoized_fibo, 100_000),
+    'iterative': (iter_fibo, 100_000),
+    'fast doubling': (fast_fibo, 100_000_000),
+}
+
+def measure(fn: Callable[[int], int], n: int) -> Tuple[Optional[float], Optional[int], Optional[int], str]:
+    try:
+        start = time.perf_counter()
+        result = fn(n)
+        seconds = time.perf_counter() - start
+        tracemalloc.start()
+        try:
+            fn(n)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except RecursionError:
+        return None, None, None, "RecursionError"
+    return seconds, peak, result, ""
+
+def sizes(limit: int) -> List[int]:
+    n, values = 10, []
+    while n <= limit:
+        values.append(n)
+        n *= 10
+    return values
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare Fibonacci implementations as n grows")
+    parser.add_argument('--max-n', type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    print(f"{'n':>12}  {'variant':<14} {'time':>12} {'peak memory':>14}")
+    for n in sizes(args.max_n):
+        expected = None
+        for name, (fn, limit) in VARIANTS.items():
+            if n > limit:
+                continue
+            seconds, peak, result, error = measure(fn, n)
+            if error:
+                print(f"{n:>12,}  {name:<14} {error:>27}")
+                continue
+            expected = result if expected is None else expected
+            assert result == expected, f"{name} disagrees at n={n}"
+            print(f"{n:>12,}  {name:<14} {seconds:>11.6f}s {peak / 1024:>11,.1f} KiB")
+
+if __name__ == '__main__':
+    main()
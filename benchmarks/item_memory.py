@@ -0,0 +1,67 @@
+import argparse
+import ast
+import os
+import tracemalloc
+from types import ModuleType
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = {
+    'rpg_items': os.path.join(ROOT, 'lab05', 'rpg_items.py'),
+    'object_relationships_rpg': os.path.join(ROOT, 'lab05', 'object_relationships_rpg.py'),
+}
+
+class StripSlots(ast.NodeTransformer):
+    def visit_ClassDef(self, node: ast.ClassDef) -> ast.ClassDef:
+        node.body = [statement for statement in node.body
+                     if not (isinstance(statement, ast.Assign)
+                             and any(isinstance(t, ast.Name) and t.id == '__slots__' for t in statement.targets))]
+        return node
+
+def load(name: str, path: str, slotted: bool) -> ModuleType:
+    with open(path, 'r') as f:
+        tree = ast.parse(f.read(), path)
+    if not slotted:
+        tree = ast.fix_missing_locations(StripSlots().visit(tree))
+    module = ModuleType(name)
+    module.__file__ = path
+    exec(compile(tree, path, 'exec'), module.__dict__)
+    return module
+
+def factories(module: ModuleType) -> Dict[str, Callable[[int], object]]:
+    makers = {
+        'Item': lambda i: module.Item('Stone', 'A plain stone'),
+        'Shield': lambda i: module.Shield('Round Shield', 50),
+        'Potion': lambda i: module.Potion('HP Potion', 'HP', 100, 0),
+    }
+    if hasattr(module, 'SingleHandedWeapon'):
+        makers['SingleHandedWeapon'] = lambda i: module.SingleHandedWeapon('Master Sword', 300, 'sword')
+    else:
+        makers['Weapon'] = lambda i: module.Weapon('Belthronding', 500, 'bow')
+    return makers
+
+def bytes_per_item(make: Callable[[int], object], count: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items: List[object] = [make(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return (after - before) / count
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-item memory of the rpg item classes with and without __slots__")
+    parser.add_argument('--count', type=int, default=200_000, help="items to allocate per class")
+    args = parser.parse_args()
+
+    for name, path in MODULES.items():
+        plain, slotted = load(name, path, slotted=False), load(name, path, slotted=True)
+        print(f"\n{os.path.relpath(path, ROOT)} ({args.count:,} items per class)")
+        print(f"  {'class':<20} {'__dict__':>10} {'__slots__':>10} {'saved':>16}")
+        for cls, make in factories(plain).items():
+            before = bytes_per_item(make, args.count)
+            after = bytes_per_item(factories(slotted)[cls], args.count)
+            print(f"  {cls:<20} {before:>9.0f}B {after:>9.0f}B {before - after:>7.0f}B ({(before - after) / before:.0%})")
+
+if __name__ == '__main__':
+    main()
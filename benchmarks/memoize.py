@@ -0,0 +1,77 @@
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'lab10'))
+
+from decorator import memoize
+
+def square(x: int) -> int:
+    return x * x
+
+def make_keys(count: int, universe: int) -> List[int]:
+    random.seed(0)
+    return [int(random.paretovariate(1.2)) % universe for _ in range(count)]
+
+def best_of(runs: int, fn: Callable[[], None]) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def coalescing(threads: int, delay: float) -> int:
+    calls = []
+
+    @memoize
+    def slow(x):
+        calls.append(x)
+        time.sleep(delay)
+        return x
+
+    workers = [threading.Thread(target=slow, args=(1,)) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return len(calls)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare memoize with functools.lru_cache")
+    parser.add_argument('--calls', type=int, default=1_000_000)
+    parser.add_argument('--universe', type=int, default=10_000, help="number of distinct keys")
+    parser.add_argument('--maxsize', type=int, default=1024)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    keys = make_keys(args.calls, args.universe)
+    variants = {
+        'lru_cache': lru_cache(maxsize=args.maxsize)(square),
+        'memoize': memoize(square, maxsize=args.maxsize),
+        'memoize, ttl=60s': memoize(square, maxsize=args.maxsize, ttl=60),
+    }
+
+    print(f"{args.calls:,} calls over {args.universe:,} keys, maxsize={args.maxsize}")
+    baseline = None
+    for name, cached in variants.items():
+        def run():
+            cached.cache_clear()
+            for key in keys:
+                cached(key)
+        seconds = best_of(args.runs, run)
+        baseline = baseline or seconds
+        info = cached.cache_info()
+        print(f"  {name:<18} {seconds:.3f}s  {args.calls / seconds:>12,.0f} calls/s  "
+              f"{seconds / baseline:.1f}x lru_cache  hit rate {info.hits / (info.hits + info.misses):.1%}")
+
+    print(f"  16 threads asking for one missing key: {coalescing(16, 0.05)} call(s) to the function")
+
+if __name__ == '__main__':
+    main()
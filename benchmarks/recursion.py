@@ -0,0 +1,61 @@
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Callable, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'lab09'))
+
+from recursion import (product_of_digits, array_to_string, log,
+                       fast_product_of_digits, fast_array_to_string, fast_log)
+
+def nonzero_digits(digits: int) -> int:
+    return 7 * (10 ** digits - 1) // 9
+
+def random_int(digits: int) -> int:
+    return random.getrandbits(int(digits * 3.33)) | 1
+
+def time_call(fn: Callable, *args) -> Tuple[str, object]:
+    start = time.perf_counter()
+    try:
+        result = fn(*args)
+    except RecursionError:
+        return "RecursionError", None
+    return f"{time.perf_counter() - start:.6f}s", result
+
+def compare(label: str, recursive: Callable, fast: Callable, *args):
+    slow_time, slow_result = time_call(recursive, *args)
+    fast_time, fast_result = time_call(fast, *args)
+    if slow_result is not None:
+        assert slow_result == fast_result, f"results differ for {label}"
+    print(f"  {label:<34} {slow_time:>16} {fast_time:>12}")
+
+def sizes(limit: int) -> List[int]:
+    n, values = 10, []
+    while n <= limit:
+        values.append(n)
+        n *= 10
+    return values
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare lab09 recursive utilities with their iterative versions")
+    parser.add_argument('--max-size', type=int, default=1_000_000, help="largest array length / digit count")
+    args = parser.parse_args()
+    random.seed(0)
+
+    print(f"  {'input':<34} {'recursive':>16} {'fast':>12}")
+    for n in sizes(args.max_size):
+        compare(f"array_to_string, {n:,} items", array_to_string, fast_array_to_string, list(range(n)), 0)
+    for n in sizes(args.max_size):
+        compare(f"product_of_digits, {n:,} digits", product_of_digits, fast_product_of_digits, random_int(n))
+    for n in sizes(args.max_size // 10):
+        compare(f"product_of_digits, {n:,} nonzero", product_of_digits, fast_product_of_digits, nonzero_digits(n))
+    for n in sizes(args.max_size):
+        compare(f"log(10, x), {n:,} digits", log, fast_log, 10, random_int(n))
+    for n in sizes(args.max_size):
+        compare(f"log(2, x), {n:,} digits", log, fast_log, 2, random_int(n))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+import argparse
+import importlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, 'assignment1'), os.path.join(ROOT, 'assignment2')]
+
+BASELINE_PATH = os.path.join(ROOT, 'benchmarks', 'baselines', 'style_checkers.json')
+REGRESSION_THRESHOLD = 25.0
+CHECKERS = {'assignment1': 'custom_style_checker', 'assignment2': 'functional_style_checker'}
+
+def tiny_module(i: int) -> str:
+    return (f'import os\n\ndef helper_{i}(x: int) -> int:\n    """Return x."""\n    return x\n\n'
+            f'class Tiny{i}:\n    def run(self, value):\n        return value\n')
+
+def huge_module(i: int, functions: int) -> str:
+    return ''.join(f'def func_{i}_{j}(a: int, b: int) -> int:\n    total = a + b\n'
+                   f'    total *= {j}\n    return total\n\n' for j in range(functions))
+
+def nested_module(i: int, depth: int) -> str:
+    lines = []
+    for level in range(depth):
+        indent = '    ' * level
+        lines.append(f'{indent}class Level{level}_{i}:\n')
+        lines.append(f'{indent}    def method_{level}(self, x):\n')
+        lines.append(f'{indent}        return x\n')
+    return ''.join(lines)
+
+def docstring_module(i: int, functions: int) -> str:
+    body = '\n'.join(f'    Line {k} of a long description for this function.' for k in range(20))
+    return ''.join(f'def documented_{i}_{j}(x: int) -> int:\n    """\n{body}\n    """\n    return x\n\n'
+                   for j in range(functions))
+
+def corpus_shapes(scale: float) -> Dict[str, Callable[[str], None]]:
+    def files(count: int, render: Callable[[int], str]) -> Callable[[str], None]:
+        def generate(directory: str) -> None:
+            for i in range(max(1, int(count * scale))):
+                with open(os.path.join(directory, f'module_{i}.py'), 'w') as f:
+                    f.write(render(i))
+        return generate
+
+    return {
+        'many_tiny_files': files(2000, tiny_module),
+        'few_huge_files': files(3, lambda i: huge_module(i, int(20_000 * scale) or 1)),
+        'deep_nesting': files(200, lambda i: nested_module(i, 40)),
+        'heavy_docstrings': files(50, lambda i: docstring_module(i, 200)),
+    }
+
+def python_files(directory: str) -> List[str]:
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.py'))
+
+def run_assignment1(csc, filepaths: List[str]) -> Dict[str, float]:
+    phases: Dict[str, float] = {}
+    for filepath in filepaths:
+        analyzer = csc.StyleAnalyzer(filepath)
+        analyzer.analyze()
+        for name, seconds in analyzer.timings.items():
+            phases[name] = phases.get(name, 0.0) + seconds
+    return phases
+
+def build_analysis(fsc, state: Dict[str, object]) -> object:
+    classes, functions = state['definitions']
+    bad_camel, bad_snake = state['naming']
+    return fsc.CodeAnalysis(
+        total_lines=state['parse'].total_lines,
+        imports=fsc.analyze_imports(state['parse']),
+        classes=classes,
+        functions=functions,
+        docstrings=state['docstrings'],
+        missing_types=state['types'],
+        bad_camelcase=bad_camel,
+        bad_snakecase=bad_snake
+    )
+
+def run_assignment2(fsc, filepaths: List[str]) -> Dict[str, float]:
+    steps = [
+        ('parse', lambda state: fsc.parse_source(fsc.iter_file(state['path']))),
+        ('definitions', lambda state: fsc.find_definitions(state['parse'])),
+        ('docstrings', lambda state: fsc.extract_docstrings(state['parse'])),
+        ('types', lambda state: fsc.check_type_annotations(state['parse'])),
+        ('naming', lambda state: fsc.check_naming_conventions(state['parse'])),
+        ('report', lambda state: fsc.write_report(state['path'], build_analysis(fsc, state))),
+    ]
+    phases = {name: 0.0 for name, _ in steps}
+    for filepath in filepaths:
+        state = {'path': filepath}
+        for name, step in steps:
+            start = time.perf_counter()
+            state[name] = step(state)
+            phases[name] += time.perf_counter() - start
+    return phases
+
+def measure(checker: str, directory: str) -> Dict[str, object]:
+    filepaths = python_files(directory)
+    lines = 0
+    for filepath in filepaths:
+        with open(filepath, 'r') as f:
+            lines += sum(1 for _ in f)
+
+    module = importlib.import_module(CHECKERS[checker])
+    runner = run_assignment1 if checker == 'assignment1' else run_assignment2
+    start = time.perf_counter()
+    phases = runner(module, filepaths)
+    seconds = time.perf_counter() - start
+
+    return {
+        'files': len(filepaths),
+        'lines': lines,
+        'seconds': round(seconds, 4),
+        'lines_per_second': round(lines / seconds) if seconds else 0,
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'phases': {name: round(value, 4) for name, value in phases.items()},
+    }
+
+def run_isolated(checker: str, directory: str) -> Dict[str, object]:
+    output = subprocess.run([sys.executable, __file__, '--measure', checker, directory],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+def compare(current: float, baseline: float, higher_is_better: bool) -> str:
+    if not baseline:
+        return ''
+    change = (current - baseline) / baseline * 100
+    worse = change < 0 if higher_is_better else change > 0
+    return f" ({change:+.1f}%{' REGRESSION' if worse and abs(change) > REGRESSION_THRESHOLD else ''})"
+
+def print_results(results: Dict[str, Dict[str, Dict[str, object]]],
+                  baseline: Dict[str, Dict[str, Dict[str, object]]]) -> None:
+    for corpus, by_checker in results.items():
+        print(f"\n{corpus}")
+        for checker, result in by_checker.items():
+            previous = baseline.get(corpus, {}).get(checker, {})
+            print(f"  {checker}: {result['files']} files, {result['lines']:,} lines, "
+                  f"{result['seconds']:.3f}s{compare(result['seconds'], previous.get('seconds'), False)}, "
+                  f"{result['lines_per_second']:,.0f} lines/s"
+                  f"{compare(result['lines_per_second'], previous.get('lines_per_second'), True)}, "
+                  f"peak RSS {result['peak_rss_kb'] / 1024:.1f} MB"
+                  f"{compare(result['peak_rss_kb'], previous.get('peak_rss_kb'), False)}")
+            for phase, seconds in result['phases'].items():
+                print(f"    {phase:<12} {seconds:.3f}s")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark both style checkers on synthetic corpora")
+    parser.add_argument('--scale', type=float, default=1.0, help="multiply corpus sizes by this factor")
+    parser.add_argument('--corpus', action='append', help="only run the named corpus (repeatable)")
+    parser.add_argument('--save-baseline', action='store_true', help=f"write results to {BASELINE_PATH}")
+    parser.add_argument('--measure', nargs=2, metavar=('CHECKER', 'DIR'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(*args.measure)))
+        return
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, 'r') as f:
+            saved = json.load(f)
+        if saved.get('scale') == args.scale:
+            baseline = saved['results']
+        else:
+            print(f"Baseline was recorded at --scale {saved.get('scale')}; not comparing")
+
+    results: Dict[str, Dict[str, Dict[str, object]]] = {}
+    for corpus, generate in corpus_shapes(args.scale).items():
+        if args.corpus and corpus not in args.corpus:
+            continue
+        with tempfile.TemporaryDirectory() as directory:
+            generate(directory)
+            results[corpus] = {checker: run_isolated(checker, directory) for checker in CHECKERS}
+
+    print_results(results, baseline)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump({'scale': args.scale, 'results': results}, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"\nBaseline saved to {BASELINE_PATH}")
+
+if __name__ == '__main__':
+    main()
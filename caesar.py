@@ -1,3 +1,54 @@
+from functools import lru_cache
+import math
+from operator import mul
+import os
+import string
+
+CHUNK_SIZE = 1024 * 1024
+KEY_PERIOD = math.lcm(26, 128)
+SAMPLE_SIZE = 4096
+ENGLISH_FREQUENCIES = [
+    8.167, 1.492, 2.782, 4.253, 12.702, 2.228, 2.015, 6.094, 6.966, 0.153, 0.772, 4.025, 2.406,
+    6.749, 7.507, 1.929, 0.095, 5.987, 6.327, 9.056, 2.758, 0.978, 2.360, 0.150, 1.974, 0.074,
+]
+# chi-squared is sum(observed ** 2 / expected) - total, so ranking only needs these weights
+CHI_SQUARED_WEIGHTS = [1 / frequency for frequency in ENGLISH_FREQUENCIES]
+
+def _shift_char(char, key):
+    if char.isalpha():
+        shifted = ord(char.lower()) + key
+        return chr((shifted - ord('a')) % 26 + ord('a'))
+    elif char.isspace():
+        return char
+    else:
+        return chr((ord(char) + key) % 128)
+
+class _ShiftTable(dict):
+    def __init__(self, key):
+        super().__init__((i, _shift_char(chr(i), key)) for i in range(256))
+        self.key = key
+
+    def __missing__(self, codepoint):
+        char = _shift_char(chr(codepoint), self.key)
+        self[codepoint] = char
+        return char
+
+@lru_cache(maxsize=128)
+def _translation_table(key):
+    return _ShiftTable(key)
+
+@lru_cache(maxsize=128)
+def _byte_table(key):
+    return bytes(ord(_shift_char(chr(i), key)) for i in range(256))
+
+def crack(ciphertext, sample_size=SAMPLE_SIZE):
+    if sample_size and len(ciphertext) > sample_size:
+        ciphertext = ciphertext[::len(ciphertext) // sample_size]
+    squares = [ciphertext.count(letter) ** 2 for letter in string.ascii_lowercase]
+    scores = [sum(map(mul, squares[key:] + squares[:key], CHI_SQUARED_WEIGHTS)) for key in range(26)]
+    return sorted(range(26), key=scores.__getitem__)
+
+
 class Caesar:
     def __init__(self):
         self._key = 0  
@@ -9,30 +60,35 @@ class Caesar:
         self._key = key
 
     def encrypt(self, plaintext):
-        ciphertext = ''
-        for char in plaintext:
-            if char.isalpha():
-                shifted = ord(char.lower()) + self._key
-                shifted = (shifted - ord('a')) % 26 + ord('a')
-                ciphertext += chr(shifted)
-            elif char.isspace():
-                ciphertext += char
-            else:
-                ciphertext += chr((ord(char) + self._key) % 128)
-        return ciphertext
+        if not isinstance(plaintext, str):
+            return ''.join(_shift_char(char, self._key) for char in plaintext)
+        return plaintext.translate(_translation_table(self._key % KEY_PERIOD))
 
     def decrypt(self, ciphertext):
-        plaintext = ''
-        for char in ciphertext:
-            if char.isalpha():
-                shifted = ord(char.lower()) - self._key
-                shifted = (shifted - ord('a')) % 26 + ord('a')
-                plaintext += chr(shifted)
-            elif char.isspace():
-                plaintext += char
-            else:
-                plaintext += chr((ord(char) - self._key) % 128)
-        return plaintext
+        if not isinstance(ciphertext, str):
+            return ''.join(_shift_char(char, -self._key) for char in ciphertext)
+        return ciphertext.translate(_translation_table(-self._key % KEY_PERIOD))
+
+    def encrypt_bytes(self, data):
+        return data.translate(_byte_table(self._key % KEY_PERIOD))
+
+    def decrypt_bytes(self, data):
+        return data.translate(_byte_table(-self._key % KEY_PERIOD))
+
+    def encrypt_file(self, source_path, target_path, chunk_size=CHUNK_SIZE):
+        return self._cipher_file(source_path, target_path, self.encrypt_bytes, chunk_size)
+
+    def decrypt_file(self, source_path, target_path, chunk_size=CHUNK_SIZE):
+        return self._cipher_file(source_path, target_path, self.decrypt_bytes, chunk_size)
+
+    def _cipher_file(self, source_path, target_path, transform, chunk_size):
+        if os.path.exists(target_path) and os.path.samefile(source_path, target_path):
+            raise ValueError(f"Input and output are the same file: {source_path}")
+        written = 0
+        with open(source_path, 'rb') as source, open(target_path, 'wb') as target:
+            while chunk := source.read(chunk_size):
+                written += target.write(transform(chunk))
+        return written
 
 
 if __name__ == '__main__':
@@ -46,4 +102,4 @@ if __name__ == '__main__':
     print(cipher.decrypt('FFF')) 
     
     cipher.set_key(-6)  
-    print(cipher.encrypt('FFF'))  
\ No newline at end of file
+    print(cipher.encrypt('FFF'))  
\ No newline at end of file
@@ -1,5 +1,7 @@
 # Base Item class
 class Item:
+    __slots__ = ('name', 'description', 'rarity', '_ownership')
+
     def __init__(self, name, description='', rarity='common'):
         self.name = name
         self.description = description
@@ -24,6 +26,8 @@ class Item:
 
 
 class Weapon(Item):
+    __slots__ = ('damage', 'type', 'is_equipped', 'attack_modifier')
+
     def __init__(self, name, damage, type, description='', rarity='common'):
         super().__init__(name, description, rarity)
         self.damage = damage
@@ -43,6 +47,8 @@ class Weapon(Item):
 
 
 class Shield(Item):
+    __slots__ = ('defense', 'is_equipped', 'broken', 'defense_modifier')
+
     def __init__(self, name, defense, description='', rarity='common', broken=False):
         super().__init__(name, description, rarity)
         self.defense = defense
@@ -62,6 +68,8 @@ class Shield(Item):
 
 
 class Potion(Item):
+    __slots__ = ('type', 'value', 'effective_time', 'is_empty')
+
     def __init__(self, name, type, value, effective_time, description='', rarity='common'):
         super().__init__(name, description, rarity)
         self.type = type
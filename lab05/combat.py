@@ -0,0 +1,153 @@
+from array import array
+from functools import lru_cache
+from itertools import compress
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from object_relationships_rpg import Item, Weapon, Shield, Potion, SingleHandedWeapon, RangedWeapon
+
+Action = Tuple[str, Item]
+KINDS = ('use', 'attack', 'block', 'potion')
+USE, ATTACK, BLOCK, POTION = range(len(KINDS))
+
+class ActionResult(NamedTuple):
+    owner: str
+    item: Item
+    kind: str
+    applied: bool
+    amount: float = 0.0
+    stat: Optional[str] = None
+    duration: int = 0
+
+    def message(self) -> str:
+        if not self.applied:
+            return ""
+        if self.kind == 'attack':
+            return f"{self.item.attack_move()}\n{self.item.name} is used, dealing {self.amount} damage"
+        if self.kind == 'block':
+            return f"{self.item.name} is used, blocking {self.amount} damage"
+        if self.kind == 'potion':
+            effect = f"{'restores' if self.stat == 'HP' else 'increases'} {self.amount}"
+            duration = f"for {self.duration}s" if self.duration > 0 else ""
+            return f"{self.owner} used {self.item.name}, and {self.stat} {effect} {duration}"
+        return f"{self.item.name} is used"
+
+class CombatResults:
+    def __init__(self, actions: List[Action]):
+        self.actions = actions
+        self.kinds = bytearray(len(actions))
+        self.applied = bytearray(len(actions))
+        self.amounts = array('d', bytes(8 * len(actions)))
+        self.effects: Dict[int, Tuple[str, float, int]] = {}
+
+    def __len__(self):
+        return len(self.actions)
+
+    def __getitem__(self, index: int) -> ActionResult:
+        owner, item = self.actions[index]
+        if index in self.effects:
+            stat, value, duration = self.effects[index]
+            return ActionResult(owner, item, 'potion', True, value, stat, duration)
+        return ActionResult(owner, item, KINDS[self.kinds[index]], bool(self.applied[index]), self.amounts[index])
+
+    def __iter__(self) -> Iterator[ActionResult]:
+        return (self[index] for index in range(len(self)))
+
+    def total(self, kind: str) -> float:
+        return sum(compress(self.amounts, map(KINDS.index(kind).__eq__, self.kinds)))
+
+    def count(self, kind: Optional[str] = None) -> int:
+        if kind is None:
+            return self.applied.count(1)
+        return sum(compress(self.applied, map(KINDS.index(kind).__eq__, self.kinds)))
+
+    def messages(self) -> Iterator[str]:
+        return (self[index].message() for index in compress(range(len(self)), self.applied))
+
+    def format(self) -> str:
+        return '\n'.join(self.messages())
+
+def resolve_weapons(actions: List[Action], indices: List[int], equip: bool, results: CombatResults):
+    kinds, applied, amounts = results.kinds, results.applied, results.amounts
+    for index in indices:
+        owner, weapon = actions[index]
+        kinds[index] = ATTACK
+        if weapon._ownership != owner or not owner:
+            continue
+        if equip:
+            weapon.is_equipped = True
+        if weapon.is_equipped:
+            applied[index] = 1
+            amounts[index] = weapon.damage * weapon.attack_modifier
+
+def resolve_shields(actions: List[Action], indices: List[int], equip: bool, results: CombatResults):
+    kinds, applied, amounts = results.kinds, results.applied, results.amounts
+    for index in indices:
+        owner, shield = actions[index]
+        kinds[index] = BLOCK
+        if shield._ownership != owner or not owner:
+            continue
+        if equip:
+            shield.is_equipped = True
+        if shield.is_equipped:
+            applied[index] = 1
+            amounts[index] = shield.defense * shield.defense_modifier * (0.5 if shield.broken else 1.0)
+
+def resolve_potions(actions: List[Action], indices: List[int], equip: bool, results: CombatResults):
+    kinds, applied, amounts = results.kinds, results.applied, results.amounts
+    for index in indices:
+        owner, potion = actions[index]
+        kinds[index] = POTION
+        if potion._ownership != owner or not owner or potion.is_empty:
+            continue
+        potion.is_empty = True
+        applied[index] = 1
+        amounts[index] = potion.value
+        results.effects[index] = (potion.type, potion.value, potion.effective_time)
+
+def resolve_items(actions: List[Action], indices: List[int], equip: bool, results: CombatResults):
+    applied = results.applied
+    for index in indices:
+        owner, item = actions[index]
+        if item._ownership != owner or not owner:
+            continue
+        applied[index] = 1
+
+RESOLVERS: List[Tuple[type, Callable]] = [
+    (Weapon, resolve_weapons),
+    (Shield, resolve_shields),
+    (Potion, resolve_potions),
+    (Item, resolve_items),
+]
+
+@lru_cache(maxsize=None)
+def resolver_for(cls: type) -> Callable:
+    return next(resolver for base, resolver in RESOLVERS if issubclass(cls, base))
+
+def resolve_actions(actions: Iterable[Action], equip: bool = True) -> CombatResults:
+    actions = list(actions)
+    groups: Dict[Callable, List[int]] = {}
+    for index, (owner, item) in enumerate(actions):
+        groups.setdefault(resolver_for(type(item)), []).append(index)
+
+    results = CombatResults(actions)
+    for resolver, indices in groups.items():
+        resolver(actions, indices, equip, results)
+    return results
+
+
+if __name__ == "__main__":
+    master_sword = SingleHandedWeapon("Master Sword", 300, "sword", rarity="legendary")
+    belthronding = RangedWeapon("Belthronding", 500, "bow", rarity="legendary")
+    round_shield = Shield("Round Shield", 50, broken=True)
+    hp_potion = Potion("HP Potion", "HP", 100, 0)
+
+    for owner, item in [("Link", master_sword), ("Beleg", belthronding), ("Beleg", round_shield), ("Beleg", hp_potion)]:
+        item.pick_up(owner)
+
+    tick = [("Link", master_sword), ("Beleg", belthronding), ("Beleg", round_shield),
+            ("Beleg", hp_potion), ("Beleg", hp_potion), ("Link", belthronding)]
+    results = resolve_actions(tick)
+
+    print(f"Damage dealt: {results.total('attack')}")
+    print(f"Damage blocked: {results.total('block')}")
+    print(results.format())
@@ -0,0 +1,221 @@
+import mmap
+import struct
+import sys
+from array import array
+from itertools import compress
+from typing import Dict, Iterator, List, Optional, Type
+
+from object_relationships_rpg import Item, Weapon, Shield, Potion, Inventory, SingleHandedWeapon, Pike
+
+MAGIC = b'INVS'
+VERSION = 1
+HEADER = struct.Struct('<4sHHQIIIQQ')
+RECORD = struct.Struct('<BBHIIIIIddd')
+
+OFFSETS = struct.Struct('<QQ')
+
+EQUIPPED, BROKEN, EMPTY, AMOUNT_IS_INT, TIME_IS_INT, UNOWNED = 1, 2, 4, 8, 16, 32
+
+def item_classes() -> Dict[str, Type[Item]]:
+    classes, pending = {}, [Item]
+    while pending:
+        cls = pending.pop()
+        if not hasattr(cls, 'item_class'):
+            classes[cls.__name__] = cls
+        pending.extend(cls.__subclasses__())
+    return classes
+
+class StringTable:
+    def __init__(self):
+        self.strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def intern(self, value: str) -> int:
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = self._ids[value] = len(self.strings)
+            self.strings.append(value)
+        return string_id
+
+def _record(item: Item, strings: StringTable, class_ids: Dict[type, int]) -> bytes:
+    cls = getattr(type(item), 'item_class', type(item))
+    flags = 0
+    type_id = strings.intern('')
+    amount = modifier = time = 0.0
+    if isinstance(item, Weapon):
+        flags |= EQUIPPED * item.is_equipped
+        type_id = strings.intern(item.type)
+        amount, modifier = item.damage, item.attack_modifier
+    elif isinstance(item, Shield):
+        flags |= EQUIPPED * item.is_equipped | BROKEN * item.broken
+        amount, modifier = item.defense, item.defense_modifier
+    elif isinstance(item, Potion):
+        flags |= EMPTY * item.is_empty | TIME_IS_INT * isinstance(item.effective_time, int)
+        type_id = strings.intern(item.type)
+        amount, time = item.value, item.effective_time
+    flags |= AMOUNT_IS_INT * isinstance(amount, int) | UNOWNED * (item._ownership is None)
+    return RECORD.pack(class_ids[cls], flags, 0, strings.intern(item.name), strings.intern(item.description),
+                       strings.intern(item.rarity), strings.intern(item._ownership or ''), type_id, amount, modifier,
+                       time)
+
+def save_inventory(inventory: Inventory, path: str) -> int:
+    strings = StringTable()
+    owner_id = strings.intern(inventory.owner or '')
+    class_ids: Dict[type, int] = {}
+    class_names: List[int] = []
+    records = bytearray()
+    count = 0
+    for item in inventory:
+        cls = getattr(type(item), 'item_class', type(item))
+        if cls not in class_ids:
+            class_ids[cls] = len(class_names)
+            class_names.append(strings.intern(cls.__name__))
+        records += _record(item, strings, class_ids)
+        count += 1
+
+    encoded = [value.encode('utf-8') for value in strings.strings]
+    offsets = array('Q', [0])
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+    classes = array('I', class_names)
+    if classes.itemsize != 4 or offsets.itemsize != 8:
+        raise RuntimeError("Unsupported platform array sizes")
+    if sys.byteorder == 'big':
+        classes.byteswap()
+        offsets.byteswap()
+
+    records_offset = HEADER.size + 4 * len(classes)
+    strings_offset = records_offset + len(records)
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, count, len(classes), len(encoded), owner_id,
+                            records_offset, strings_offset))
+        f.write(classes.tobytes())
+        f.write(records)
+        f.write(offsets.tobytes())
+        for value in encoded:
+            f.write(value)
+        return f.tell()
+
+class InventorySnapshot:
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size, count, class_count, string_count, owner_id, records_offset, strings_offset = \
+            HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an inventory snapshot")
+        if version != VERSION or record_size != RECORD.size:
+            raise ValueError(f"Unsupported snapshot version {version} (record size {record_size})")
+
+        self._count = count
+        self._records_offset = records_offset
+        self._offsets_offset = strings_offset
+        self._blob_offset = strings_offset + 8 * (string_count + 1)
+        self._strings: Dict[int, str] = {}
+        self._items: Dict[int, Item] = {}
+
+        known = item_classes()
+        names = struct.unpack_from(f'<{class_count}I', self._map, HEADER.size)
+        missing = [self.string(name) for name in names if self.string(name) not in known]
+        if missing:
+            raise ValueError(f"Snapshot uses unknown item classes: {', '.join(missing)}")
+        self.classes: List[Type[Item]] = [known[self.string(name)] for name in names]
+        self._kinds = [next((base for base in (Weapon, Shield, Potion) if issubclass(cls, base)), Item)
+                       for cls in self.classes]
+        self.owner = self.string(owner_id) or None
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def string(self, string_id: int) -> str:
+        value = self._strings.get(string_id)
+        if value is None:
+            start, end = OFFSETS.unpack_from(self._map, self._offsets_offset + 8 * string_id)
+            value = self._map[self._blob_offset + start:self._blob_offset + end].decode('utf-8')
+            self._strings[string_id] = value
+        return value
+
+    def __getitem__(self, index: int) -> Item:
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        item = self._items.get(index)
+        if item is None:
+            item = self._items[index] = self._materialize(index)
+        return item
+
+    def __iter__(self) -> Iterator[Item]:
+        return (self[index] for index in range(self._count))
+
+    def _materialize(self, index: int) -> Item:
+        class_id, flags, _, name, description, rarity, owner, type_id, amount, modifier, time = \
+            RECORD.unpack_from(self._map, self._records_offset + index * RECORD.size)
+        cls, kind = self.classes[class_id], self._kinds[class_id]
+        item = cls.__new__(cls)
+        item.name = self.string(name)
+        item.description = self.string(description)
+        item.rarity = self.string(rarity)
+        item._ownership = None if flags & UNOWNED else self.string(owner)
+        if flags & AMOUNT_IS_INT:
+            amount = int(amount)
+        if kind is Weapon:
+            item.damage, item.type, item.attack_modifier = amount, self.string(type_id), modifier
+            item.is_equipped = bool(flags & EQUIPPED)
+        elif kind is Shield:
+            item.defense, item.defense_modifier = amount, modifier
+            item.is_equipped, item.broken = bool(flags & EQUIPPED), bool(flags & BROKEN)
+        elif kind is Potion:
+            item.type, item.value = self.string(type_id), amount
+            item.effective_time = int(time) if flags & TIME_IS_INT else time
+            item.is_empty = bool(flags & EMPTY)
+        return item
+
+    def class_column(self) -> bytes:
+        start = self._records_offset
+        return self._map[start:start + self._count * RECORD.size:RECORD.size]
+
+    def indices(self, type: Optional[str] = None) -> List[int]:
+        if not type:
+            return list(range(self._count))
+        codes = bytes(any(base.__name__.lower() == type.lower() for base in cls.__mro__) for cls in self.classes)
+        mask = self.class_column().translate(codes.ljust(256, b'\x00'))
+        return list(compress(range(self._count), mask))
+
+    def to_inventory(self) -> Inventory:
+        inventory = Inventory(self.owner)
+        for item in self:
+            ownership = item._ownership
+            inventory.add_item(item)
+            item._ownership = ownership
+        return inventory
+
+def load_inventory(path: str) -> InventorySnapshot:
+    return InventorySnapshot(path)
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    backpack = Inventory(owner="Beleg")
+    for item in [SingleHandedWeapon("Master Sword", 300, "sword", rarity="legendary"),
+                 Pike("Gungnir", 290, "spear", rarity="legendary"),
+                 Shield("Broken Pot Lid", 5, broken=True),
+                 Potion("HP Potion", "HP", 100, 0)]:
+        backpack.add_item(item)
+
+    path = os.path.join(tempfile.mkdtemp(), 'beleg.invs')
+    print(f"Saved {save_inventory(backpack, path)} bytes")
+
+    with load_inventory(path) as snapshot:
+        print(f"{len(snapshot)} items, weapons at {snapshot.indices(type='weapon')}")
+        print(snapshot[1])
+        print(snapshot.to_inventory().view(type='shield'))
@@ -0,0 +1,222 @@
+from array import array
+from itertools import compress
+from operator import mul
+from typing import Dict, Iterable, List, Type
+
+from object_relationships_rpg import Item, Weapon, Shield, SingleHandedWeapon, Pike
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BROKEN_PENALTY = 0.5
+
+def _string_field(column: str, optional: bool = False) -> property:
+    def get(self):
+        return self.table.strings[getattr(self.table, column)[self.row]]
+
+    def set(self, value):
+        getattr(self.table, column)[self.row] = self.table.intern((value or '') if optional else value)
+    return property(get, set)
+
+def _rarity_field(column: str) -> property:
+    field = _string_field(column)
+
+    def set(self, value):
+        for inventory in getattr(self, '_inventories', ()):
+            inventory._reindex_rarity(self, value)
+        field.fset(self, value)
+    return field.setter(set)
+
+def _number_field(column: str) -> property:
+    def get(self):
+        return getattr(self.table, column)[self.row]
+
+    def set(self, value):
+        getattr(self.table, column)[self.row] = value
+    return property(get, set)
+
+def _flag_field(column: str) -> property:
+    def get(self):
+        return bool(getattr(self.table, column)[self.row])
+
+    def set(self, value):
+        getattr(self.table, column)[self.row] = bool(value)
+    return property(get, set)
+
+def _and_masks(a: bytes, b: bytes) -> bytes:
+    return (int.from_bytes(a, 'little') & int.from_bytes(b, 'little')).to_bytes(len(a), 'little')
+
+class RowView:
+    __slots__ = ()
+
+    name = _string_field('name_ids')
+    description = _string_field('description_ids')
+    rarity = _rarity_field('rarity_ids')
+    _ownership = _string_field('owner_ids', optional=True)
+    type = _string_field('type_ids')
+    damage = _number_field('damage')
+    defense = _number_field('defense')
+    attack_modifier = _number_field('modifier')
+    defense_modifier = _number_field('modifier')
+    is_equipped = _flag_field('equipped')
+    broken = _flag_field('broken')
+
+    def __str__(self):
+        return self.render()
+
+    def __repr__(self):
+        return f"<{type(self).__name__} row {self.row} of {self.table!r}>"
+
+class ItemTable:
+    def __init__(self):
+        self.strings: List[str] = ['']
+        self._string_ids: Dict[str, int] = {'': 0}
+        self.classes: List[Type[Item]] = []
+        self._class_ids: Dict[Type[Item], int] = {}
+        self._view_classes: Dict[Type[Item], type] = {}
+
+        self.class_ids = array('B')
+        self.name_ids = array('I')
+        self.description_ids = array('I')
+        self.rarity_ids = array('I')
+        self.owner_ids = array('I')
+        self.type_ids = array('I')
+        self.damage = array('d')
+        self.defense = array('d')
+        self.modifier = array('d')
+        self.equipped = array('B')
+        self.broken = array('B')
+
+    @classmethod
+    def from_items(cls, items: Iterable[Item]) -> 'ItemTable':
+        table = cls()
+        for item in items:
+            table.add(item)
+        return table
+
+    def __len__(self):
+        return len(self.class_ids)
+
+    def __iter__(self):
+        return (self.view(row) for row in range(len(self)))
+
+    def intern(self, value: str) -> int:
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = self._string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return string_id
+
+    def add(self, item: Item) -> int:
+        if not isinstance(item, (Weapon, Shield)):
+            raise TypeError(f"ItemTable only stores weapons and shields, got {type(item).__name__}")
+        cls = item.item_class if isinstance(item, RowView) else type(item)
+        if cls not in self._class_ids:
+            self._class_ids[cls] = len(self.classes)
+            self.classes.append(cls)
+        weapon = isinstance(item, Weapon)
+
+        self.class_ids.append(self._class_ids[cls])
+        self.name_ids.append(self.intern(item.name))
+        self.description_ids.append(self.intern(item.description))
+        self.rarity_ids.append(self.intern(item.rarity))
+        self.owner_ids.append(self.intern(item._ownership or ''))
+        self.type_ids.append(self.intern(item.type) if weapon else 0)
+        self.damage.append(item.damage if weapon else 0.0)
+        self.defense.append(0.0 if weapon else item.defense)
+        self.modifier.append(item.attack_modifier if weapon else item.defense_modifier)
+        self.equipped.append(item.is_equipped)
+        self.broken.append(False if weapon else item.broken)
+        return len(self) - 1
+
+    def view(self, row: int) -> Item:
+        cls = self.classes[self.class_ids[row]]
+        view_class = self._view_classes.get(cls)
+        if view_class is None:
+            view_class = type(f'{cls.__name__}Row', (RowView, cls), {'__slots__': ('table', 'row'), 'item_class': cls})
+            self._view_classes[cls] = view_class
+        view = view_class.__new__(view_class)
+        view.table = self
+        view.row = row
+        return view
+
+    def _class_codes(self, kind: str) -> List[int]:
+        return [code for code, cls in enumerate(self.classes)
+                if any(base.__name__.lower() == kind.lower() for base in cls.__mro__)]
+
+    def _rows(self, kind=None, rarity=None, equipped=None, broken=None, owner=None, owned=False):
+        filters = []
+        if kind is not None:
+            filters.append((self.class_ids, self._class_codes(kind)))
+        if rarity is not None:
+            filters.append((self.rarity_ids, [self._string_ids.get(rarity, -1)]))
+        if owner is not None:
+            filters.append((self.owner_ids, [self._string_ids.get(owner, -1)]))
+        if equipped is not None:
+            filters.append((self.equipped, [int(equipped)]))
+        if broken is not None:
+            filters.append((self.broken, [int(broken)]))
+
+        if np is not None:
+            mask = np.ones(len(self), dtype=bool)
+            for column, codes in filters:
+                values = np.frombuffer(column, dtype=column.typecode)
+                selected = np.zeros(len(self), dtype=bool)
+                for code in codes:
+                    selected |= values == code
+                mask &= selected
+            if owned:
+                mask &= np.frombuffer(self.owner_ids, dtype=self.owner_ids.typecode) != 0
+            return mask
+
+        mask = b'\x01' * len(self)
+        for column, codes in filters:
+            if column.typecode == 'B':
+                selected = column.tobytes().translate(bytes(code in codes for code in range(256)))
+            else:
+                selected = bytes(map(set(codes).__contains__, column))
+            mask = _and_masks(mask, selected)
+        if owned:
+            mask = _and_masks(mask, bytes(map(bool, self.owner_ids)))
+        return mask
+
+    def count(self, kind=None, rarity=None, equipped=None, broken=None, owner=None) -> int:
+        rows = self._rows(kind, rarity, equipped, broken, owner)
+        return int(np.count_nonzero(rows)) if np is not None else rows.count(1)
+
+    def total_equipped_damage(self, owner=None) -> float:
+        rows = self._rows('weapon', equipped=True, owner=owner, owned=True)
+        if np is not None:
+            return float(np.einsum('i,i,i->', np.frombuffer(self.damage), np.frombuffer(self.modifier), rows))
+        return sum(compress(map(mul, self.damage, self.modifier), rows))
+
+    def effective_defense(self, owner=None) -> float:
+        rows = self._rows('shield', equipped=True, owner=owner, owned=True)
+        if np is not None:
+            defense, modifier = np.frombuffer(self.defense), np.frombuffer(self.modifier)
+            broken = rows & np.frombuffer(self.broken, dtype=bool)
+            return float(np.einsum('i,i,i->', defense, modifier, rows)
+                         - (1 - BROKEN_PENALTY) * np.einsum('i,i,i->', defense, modifier, broken))
+        penalty = map((1.0, BROKEN_PENALTY).__getitem__, self.broken)
+        return sum(compress(map(mul, map(mul, self.defense, self.modifier), penalty), rows))
+
+
+if __name__ == "__main__":
+    table = ItemTable.from_items([
+        SingleHandedWeapon("Master Sword", 300, "sword", rarity="legendary"),
+        Pike("Gungnir", 290, "spear", rarity="legendary"),
+        Shield("Broken Pot Lid", 5, broken=True),
+        Shield("Round Shield", 50),
+    ])
+
+    for item in table:
+        item.pick_up("Beleg")
+        item.equip()
+
+    sword = table.view(0)
+    print(sword.use())
+    print(f"Total equipped damage: {table.total_equipped_damage()}")
+    print(f"Effective defense: {table.effective_defense()}")
+    print(f"Legendary weapons: {table.count(kind='weapon', rarity='legendary')}")
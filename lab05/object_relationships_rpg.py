@@ -1,16 +1,51 @@
-from typing import List, Union, Protocol, runtime_checkable
+from itertools import islice
+from typing import Dict, Iterator, List, Union, Protocol, runtime_checkable
 from abc import ABC, abstractmethod
 
+BANNER_RULE = '*' * 20
+
 @runtime_checkable
 class Usable(Protocol):
     def use(self) -> str: ...
 
 class Item:
+    __slots__ = ('_name', '_description', '_rarity', '_ownership', '_rendered', '_inventories')
+
     def __init__(self, name, description='', rarity='common'):
         self.name = name
         self.description = description
         self.rarity = rarity
         self._ownership = ''
+        self._inventories = ()
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        self._rendered = None
+
+    @property
+    def description(self):
+        return self._description
+
+    @description.setter
+    def description(self, value):
+        self._description = value
+        self._rendered = None
+
+    @property
+    def rarity(self):
+        return self._rarity
+
+    @rarity.setter
+    def rarity(self, value):
+        for inventory in getattr(self, '_inventories', ()):
+            inventory._reindex_rarity(self, value)
+        self._rarity = value
+        self._rendered = None
 
     def pick_up(self, character: str) -> str:
         self._ownership = character
@@ -25,13 +60,20 @@ class Item:
             return ""
         return f"{self.name} is used"
 
-    def __str__(self):
+    def render(self) -> str:
         base_str = f"{self.name} ({self.rarity}): {self.description}"
         if self.rarity == 'legendary':
-            return f"**LEGENDARY**\n{'*' * 20}\n*  {self.name.upper()}  *\n{'*' * 20}\n{base_str}"
+            return f"**LEGENDARY**\n{BANNER_RULE}\n*  {self.name.upper()}  *\n{BANNER_RULE}\n{base_str}"
         return base_str
 
+    def __str__(self):
+        if self._rendered is None:
+            self._rendered = self.render()
+        return self._rendered
+
 class Weapon(Item):
+    __slots__ = ('damage', 'type', 'is_equipped', 'attack_modifier')
+
     def __init__(self, name, damage, type, description='', rarity='common'):
         super().__init__(name, description, rarity)
         self.damage = damage
@@ -54,22 +96,32 @@ class Weapon(Item):
         pass
 
 class SingleHandedWeapon(Weapon):
+    __slots__ = ()
+
     def attack_move(self) -> str:
         return f"{self._ownership} slashes with {self.name}"
 
 class DoubleHandedWeapon(Weapon):
+    __slots__ = ()
+
     def attack_move(self) -> str:
         return f"{self._ownership} spins {self.name}"
 
 class Pike(Weapon):
+    __slots__ = ()
+
     def attack_move(self) -> str:
         return f"{self._ownership} thrusts {self.name}"
 
 class RangedWeapon(Weapon):
+    __slots__ = ()
+
     def attack_move(self) -> str:
         return f"{self._ownership} shoots {self.name}"
 
 class Shield(Item):
+    __slots__ = ('defense', 'is_equipped', 'broken', 'defense_modifier')
+
     def __init__(self, name, defense, description='', rarity='common', broken=False):
         super().__init__(name, description, rarity)
         self.defense = defense
@@ -88,6 +140,8 @@ class Shield(Item):
         return f"{self.name} is used, blocking {defense_power} damage"
 
 class Potion(Item):
+    __slots__ = ('type', 'value', 'effective_time', 'is_empty')
+
     def __init__(self, name, type, value, effective_time, description='', rarity='common'):
         super().__init__(name, description, rarity)
         self.type = type
@@ -112,30 +166,87 @@ class Potion(Item):
 class Inventory:
     def __init__(self, owner=None):
         self.owner = owner
-        self.items: List[Item] = []
+        self._items: Dict[Item, str] = {}
+        self._by_type: Dict[str, Dict[Item, None]] = {}
+        self._by_rarity: Dict[str, Dict[Item, None]] = {}
+
+    @property
+    def items(self) -> List[Item]:
+        return list(self._items)
 
     def add_item(self, item: Item):
-        if isinstance(item, Item):
-            self.items.append(item)
+        if isinstance(item, Item) and item not in self._items:
+            self._items[item] = item.rarity
+            for cls in type(item).__mro__:
+                if issubclass(cls, Item):
+                    self._by_type.setdefault(cls.__name__.lower(), {})[item] = None
+            self._by_rarity.setdefault(item.rarity, {})[item] = None
+            item._inventories = getattr(item, '_inventories', ()) + (self,)
             item.pick_up(self.owner)
 
     def remove_item(self, item: Item):
-        if item in self.items:
-            self.items.remove(item)
+        if item in self._items:
+            rarity = self._items.pop(item)
+            for cls in type(item).__mro__:
+                if issubclass(cls, Item):
+                    self._discard(self._by_type, cls.__name__.lower(), item)
+            self._discard(self._by_rarity, rarity, item)
+            item._inventories = tuple(inventory for inventory in item._inventories if inventory is not self)
             item.throw_away()
 
-    def view(self, type=None, item=None):
+    def _discard(self, index: Dict[str, Dict[Item, None]], key: str, item: Item):
+        bucket = index[key]
+        del bucket[item]
+        if not bucket:
+            del index[key]
+
+    def _reindex_rarity(self, item: Item, rarity: str):
+        previous = self._items[item]
+        if previous != rarity:
+            self._discard(self._by_rarity, previous, item)
+            self._by_rarity.setdefault(rarity, {})[item] = None
+            self._items[item] = rarity
+
+    def _buckets(self, type=None, rarity=None) -> List[Dict[Item, None]]:
+        buckets = []
+        if type:
+            buckets.append(self._by_type.get(type.lower(), {}))
+        if rarity:
+            buckets.append(self._by_rarity.get(rarity, {}))
+        return sorted(buckets, key=len)
+
+    def select(self, type=None, rarity=None) -> List[Item]:
+        return list(self.iter_select(type, rarity))
+
+    def iter_select(self, type=None, rarity=None) -> Iterator[Item]:
+        buckets = self._buckets(type, rarity)
+        if not buckets:
+            return iter(self._items)
+        if len(buckets) == 1:
+            return iter(buckets[0])
+        smallest, other = buckets
+        return (item for item in smallest if item in other)
+
+    def view(self, type=None, item=None, rarity=None):
         if item:
             return str(item)
-        if type:
-            return [str(item) for item in self.items if isinstance(item, eval(type.capitalize()))]
-        return [str(item) for item in self.items]
+        return [str(item) for item in self.select(type, rarity)]
+
+    def iter_view(self, type=None, rarity=None, start=0, stop=None) -> Iterator[str]:
+        return map(str, islice(self.iter_select(type, rarity), start, stop))
+
+    def view_page(self, page, page_size=20, type=None, rarity=None) -> List[str]:
+        start = page * page_size
+        return list(self.iter_view(type, rarity, start, start + page_size))
 
     def __iter__(self):
-        return iter(self.items)
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
 
     def __contains__(self, item):
-        return item in self.items
+        return item in self._items
 
 
 if __name__ == "__main__":
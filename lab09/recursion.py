@@ -1,3 +1,7 @@
+from itertools import chain
+from math import log2, prod
+from typing import Iterator
+
 def product_of_digits(x: int) -> int:
     x = abs(x)
     
@@ -24,6 +28,82 @@ def log(base: int, value: int) -> int:
         
     return 1 + log(base, value // base)
 
+DIGIT_CHUNK = 1000
+CHUNK_LIMIT = 10 ** DIGIT_CHUNK
+
+def _digit_chunks(x: int) -> Iterator[str]:
+    powers = [CHUNK_LIMIT]
+    while powers[-1] * powers[-1] <= x:
+        powers.append(powers[-1] * powers[-1])
+    stack = [(x, len(powers) - 1, False)]
+    while stack:
+        value, level, padded = stack.pop()
+        if level < 0:
+            yield str(value).zfill(DIGIT_CHUNK) if padded else str(value)
+            continue
+        high, low = divmod(value, powers[level])
+        if high or padded:
+            stack.append((low, level - 1, True))
+            stack.append((high, level - 1, padded))
+        else:
+            stack.append((low, level - 1, padded))
+
+def fast_product_of_digits(x: int) -> int:
+    x = abs(x)
+    if x < 10:
+        return x
+    if not isinstance(x, int):
+        digits = []
+        while not x < 10:
+            if x != x:
+                raise RecursionError("maximum recursion depth exceeded")
+            digits.append(x % 10)
+            x //= 10
+        for digit in reversed(digits):
+            x = digit * x
+        return x
+    if x < CHUNK_LIMIT:
+        digits = str(x)
+        return 0 if '0' in digits else prod(map(int, digits))
+    if '0' in str(x % CHUNK_LIMIT).zfill(DIGIT_CHUNK):
+        return 0
+    counts = dict.fromkeys('23456789', 0)
+    for chunk in _digit_chunks(x):
+        if '0' in chunk:
+            return 0
+        for digit in counts:
+            counts[digit] += chunk.count(digit)
+    return prod(int(digit) ** count for digit, count in counts.items())
+
+def fast_array_to_string(a: list, index: int) -> str:
+    if index >= len(a):
+        return ""
+    if index < 0:
+        return ",".join(map(str, chain([a[i] for i in range(index, 0)], a)))
+    return ",".join(map(str, a[index:]))
+
+def fast_log(base: int, value: int) -> int:
+    if base <= 1 or value <= 0:
+        raise ValueError("Base must be > 1 and value must be > 0")
+    if not isinstance(base, int) or not isinstance(value, int):
+        result = 0
+        while value >= base:
+            value //= base
+            result += 1
+        return result
+    if base & (base - 1) == 0:
+        return (value.bit_length() - 1) // (base.bit_length() - 1)
+
+    result = int((value.bit_length() - 1) / log2(base))
+    power = base ** result
+    while power > value:
+        power //= base
+        result -= 1
+    while power * base <= value:
+        power *= base
+        result += 1
+    return result
+
 if __name__ == "__main__":
 
     print("Testing product_of_digits:")
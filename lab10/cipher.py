@@ -1,3 +1,18 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import accumulate
+from typing import List, Optional, Sequence, Union
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+KEY_PERIOD = math.lcm(26, 128)
+SEPARATOR = '\x1f'
+PARALLEL_THRESHOLD = 100_000
+
 def shift_char(char: str, key: int) -> str:
     if char.isalpha():
         base = ord('a')
@@ -8,20 +23,77 @@ def shift_char(char: str, key: int) -> str:
     else:
         return chr((ord(char) + key) % 128)
 
+class ShiftTable(dict):
+    def __init__(self, key: int):
+        super().__init__((i, shift_char(chr(i), key)) for i in range(256))
+        self.key = key
+
+    def __missing__(self, codepoint: int) -> str:
+        char = shift_char(chr(codepoint), self.key)
+        self[codepoint] = char
+        return char
+
+@lru_cache(maxsize=128)
+def translation_table(key: int) -> ShiftTable:
+    return ShiftTable(key)
+
+@lru_cache(maxsize=128)
+def byte_table(key: int) -> bytes:
+    return bytes(ord(shift_char(chr(i), key)) for i in range(256))
+
 def encrypt(text: str, key: int) -> str:
-    return ''.join(shift_char(char, key) for char in text)
+    if not isinstance(text, str):
+        return ''.join(shift_char(char, key) for char in text)
+    return text.translate(translation_table(key % KEY_PERIOD))
 
 def decrypt(text: str, key: int) -> str:
     return encrypt(text, -key)
 
+def encrypt_many(texts: Sequence[str], key: int, workers: Optional[int] = None) -> List[str]:
+    if workers and workers > 1 and len(texts) >= PARALLEL_THRESHOLD:
+        step = -(-len(texts) // workers)
+        batches = [texts[i:i + step] for i in range(0, len(texts), step)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return [text for batch in executor.map(encrypt_many, batches, [key] * len(batches)) for text in batch]
+
+    joined = SEPARATOR.join(texts)
+    if not joined:
+        return list(texts)
+    shifted = joined.translate(translation_table(key % KEY_PERIOD))
+    if shifted.count(SEPARATOR) == len(texts) - 1:
+        return shifted.split(SEPARATOR)
+    ends = list(accumulate(len(text) + 1 for text in texts))
+    return [shifted[end - len(text) - 1:end - 1] for text, end in zip(texts, ends)]
+
+def decrypt_many(texts: Sequence[str], key: int, workers: Optional[int] = None) -> List[str]:
+    return encrypt_many(texts, -key, workers)
+
+def encrypt_bytes(data: bytes, key: int) -> bytes:
+    return data.translate(byte_table(key % KEY_PERIOD))
+
+def decrypt_bytes(data: bytes, key: int) -> bytes:
+    return encrypt_bytes(data, -key)
+
+def encrypt_array(data: Union[bytes, bytearray, memoryview, 'np.ndarray'], key: int) -> Union[bytearray, 'np.ndarray']:
+    table = byte_table(key % KEY_PERIOD)
+    if np is None or not isinstance(data, np.ndarray):
+        return bytearray(data).translate(table)
+    if data.dtype != np.uint8:
+        raise TypeError(f"Expected a uint8 array, got {data.dtype}")
+    shifted = bytearray(np.ascontiguousarray(data)).translate(table)
+    return np.frombuffer(shifted, dtype=np.uint8).reshape(data.shape)
+
+def decrypt_array(data: Union[bytes, bytearray, memoryview, 'np.ndarray'], key: int) -> Union[bytearray, 'np.ndarray']:
+    return encrypt_array(data, -key)
+
 if __name__ == '__main__':
     test_key = 3
     print(encrypt('hello WORLD!', test_key))
     print(decrypt('KHOOR zruog$', test_key))
-    
+
     test_key_2 = 6
     print(encrypt('zzz', test_key_2))
     print(decrypt('FFF', test_key_2))
-    
+
     test_key_3 = -6
-    print(encrypt('FFF', test_key_3))
\ No newline at end of file
+    print(encrypt('FFF', test_key_3))
@@ -1,13 +1,214 @@
+import asyncio
+import inspect
+import pickle
+import sqlite3
+import threading
 import time
-from functools import wraps
+from collections import OrderedDict
+from functools import partial, wraps
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Tuple, Union
+
+from disk_cache import DiskCache, stable_key
+
+_KWARGS = object()
+_FAST_TYPES = {int, str}
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+    disk_hits: int = 0
+
+def make_key(args: tuple, kwargs: dict) -> Hashable:
+    if kwargs:
+        return args + (_KWARGS,) + tuple(sorted(kwargs.items()))
+    if len(args) == 1 and type(args[0]) in _FAST_TYPES:
+        return args[0]
+    return args
+
+class LRUCache:
+    def __init__(self, maxsize: Optional[int] = 128, ttl: Optional[float] = None):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"maxsize must be None or >= 0, got {maxsize}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be None or > 0, got {ttl}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self._data: 'OrderedDict[Hashable, Tuple[Any, float]]' = OrderedDict()
+        self.hits = self.misses = self.evictions = self.disk_hits = 0
+
+    def expire(self, key: Hashable):
+        del self._data[key]
+        self.evictions += 1
+
+    def put(self, key: Hashable, value: Any):
+        if self.maxsize == 0:
+            return
+        data = self._data
+        now = time.monotonic() if self.ttl else 0.0
+        data[key] = (value, now + self.ttl if self.ttl else 0.0)
+        data.move_to_end(key)
+        while self.ttl and data:
+            oldest = next(iter(data))
+            if data[oldest][1] > now:
+                break
+            del data[oldest]
+            self.evictions += 1
+        if self.maxsize is not None and len(data) > self.maxsize:
+            data.popitem(last=False)
+            self.evictions += 1
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data), self.disk_hits)
+
+    def clear(self):
+        self._data.clear()
+        self.hits = self.misses = self.evictions = self.disk_hits = 0
+
+class _Call:
+    __slots__ = ('done', 'thread', 'value', 'error')
+
+    def __init__(self):
+        self.done = threading.Lock()
+        self.done.acquire()
+        self.thread = threading.get_ident()
+        self.value = self.error = None
+
+    def wait(self) -> Any:
+        with self.done:
+            pass
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+def _disk_lookup(disk: DiskCache, func: Callable, args: tuple, kwargs: dict) -> Tuple[Optional[bytes], bool, Any]:
+    try:
+        key = stable_key(func, args, kwargs)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None, False, None
+    try:
+        return (key,) + disk.get(key)
+    except sqlite3.Error:
+        return key, False, None
+
+def _disk_store(disk: DiskCache, key: bytes, value: Any):
+    try:
+        disk.put(key, value)
+    except sqlite3.Error:
+        pass
+
+def memoize(func: Optional[Callable] = None, *, maxsize: Optional[int] = 128, ttl: Optional[float] = None,
+            disk: Union[None, str, DiskCache] = None):
+    if func is None:
+        return lambda func: memoize(func, maxsize=maxsize, ttl=ttl, disk=disk)
+    if isinstance(disk, str):
+        disk = DiskCache(disk, ttl=ttl)
+
+    cache = LRUCache(maxsize, ttl)
+    lock, lookup, touch = cache.lock, cache._data.get, cache._data.move_to_end
+    pending = {}
+
+    async def compute(args: tuple, kwargs: dict) -> Any:
+        disk_key = None
+        if disk is not None:
+            disk_key, found, value = await asyncio.to_thread(_disk_lookup, disk, func, args, kwargs)
+            if found:
+                with lock:
+                    cache.disk_hits += 1
+                return value
+        value = await func(*args, **kwargs)
+        if disk_key is not None:
+            await asyncio.to_thread(_disk_store, disk, disk_key, value)
+        return value
+
+    def finish(key: Hashable, task: asyncio.Task):
+        with lock:
+            if pending.get(key) is task:
+                del pending[key]
+            if not task.cancelled() and task.exception() is None:
+                cache.put(key, task.result())
 
-def memoize(func):
-    cache = {}
     @wraps(func)
-    def wrapper(*args):
-        if args not in cache:
-            cache[args] = func(*args)
-        return cache[args]
+    async def async_wrapper(*args, **kwargs):
+        key = args[0] if not kwargs and len(args) == 1 and type(args[0]) in _FAST_TYPES else make_key(args, kwargs)
+        loop = asyncio.get_running_loop()
+        with lock:
+            entry = lookup(key)
+            if entry is not None and (not entry[1] or entry[1] > time.monotonic()):
+                touch(key)
+                cache.hits += 1
+                return entry[0]
+            if entry is not None:
+                cache.expire(key)
+            task = pending.get(key)
+            if task is not None and task.get_loop() is loop:
+                cache.hits += 1
+            else:
+                cache.misses += 1
+                task = pending[key] = loop.create_task(compute(args, kwargs))
+                task.add_done_callback(partial(finish, key))
+        if task is asyncio.current_task():
+            return await func(*args, **kwargs)
+        return await asyncio.shield(task)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        key = args[0] if not kwargs and len(args) == 1 and type(args[0]) in _FAST_TYPES else make_key(args, kwargs)
+        with lock:
+            entry = lookup(key)
+            if entry is not None and (not entry[1] or entry[1] > time.monotonic()):
+                touch(key)
+                cache.hits += 1
+                return entry[0]
+            if entry is not None:
+                cache.expire(key)
+            call = pending.get(key)
+            if call is not None and call.thread != threading.get_ident():
+                cache.hits += 1
+            else:
+                cache.misses += 1
+                call = pending[key] = _Call()
+        if call.thread != threading.get_ident():
+            return call.wait()
+
+        try:
+            disk_key, found, call.value = _disk_lookup(disk, func, args, kwargs) if disk is not None else (None, False, None)
+            if found:
+                with lock:
+                    cache.disk_hits += 1
+            else:
+                call.value = func(*args, **kwargs)
+                if disk_key is not None:
+                    _disk_store(disk, disk_key, call.value)
+        except BaseException as e:
+            call.error = e
+            raise
+        else:
+            with lock:
+                cache.put(key, call.value)
+            return call.value
+        finally:
+            with lock:
+                if pending.get(key) is call:
+                    del pending[key]
+            call.done.release()
+
+    def cache_info() -> CacheInfo:
+        with cache.lock:
+            return cache.info()
+
+    def cache_clear():
+        with cache.lock:
+            cache.clear()
+
+    if inspect.iscoroutinefunction(func):
+        wrapper = async_wrapper
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    wrapper.cache_disk = disk
     return wrapper
 
 def recur_fibo(n: int) -> int:
@@ -23,6 +224,17 @@ def memoized_fibo(n: int) -> int:
     else:
         return memoized_fibo(n-1) + memoized_fibo(n-2)
 
+def fast_fibo(n: int) -> int:
+    if n < 0:
+        raise ValueError(f"n must be >= 0, got {n}")
+    bits = bin(n)[2:]
+    a, b = 0, 1
+    for bit in bits[:-1]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        a, b = (d, c + d) if bit == '1' else (c, d)
+    return a * a + b * b if bits[-1] == '1' else a * (2 * b - a)
+
 if __name__ == '__main__':
     n = 35
     start_time = time.time()
@@ -32,14 +244,19 @@ if __name__ == '__main__':
     start_time = time.time()
     result2 = memoized_fibo(n)
     memoized_time = time.time() - start_time
+
+    start_time = time.time()
+    result3 = fast_fibo(n)
+    fast_time = time.time() - start_time
     
     print(f"\nPerformance comparison for n = {n}:")
     print(f"Original recursive time: {original_time:.4f} seconds")
     print(f"Memoized recursive time: {memoized_time:.4f} seconds")
+    print(f"Fast doubling time: {fast_time:.6f} seconds")
     
     if memoized_time > 0:
         print(f"Speed improvement: {original_time/memoized_time:.1f}x faster")
     else:
         print(f"Speed improvement: >100000x faster (memoized time too small to measure)")
     
-    print(f"Both implementations returned: {result1} (verified: {result1 == result2})")
\ No newline at end of file
+    print(f"All implementations returned: {result1} (verified: {result1 == result2 == result3})")
\ No newline at end of file
@@ -0,0 +1,140 @@
+import hashlib
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Optional, Tuple
+
+PICKLE_PROTOCOL = 4
+UNPICKLE_ERRORS = (pickle.UnpicklingError, AttributeError, ImportError, EOFError, IndexError, TypeError, ValueError)
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS entries (
+    key BLOB PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+'''
+
+def _canonical_bytes(value: Any) -> bytes:
+    return pickle.dumps(canonical(value), protocol=PICKLE_PROTOCOL)
+
+def canonical(value: Any) -> Any:
+    kind = type(value)
+    if kind in (tuple, list):
+        return (kind.__name__, tuple(canonical(item) for item in value))
+    if kind in (set, frozenset):
+        return (kind.__name__, tuple(sorted((canonical(item) for item in value), key=_canonical_bytes)))
+    if kind is dict:
+        items = ((canonical(key), canonical(item)) for key, item in value.items())
+        return ('dict', tuple(sorted(items, key=lambda pair: _canonical_bytes(pair[0]))))
+    return value
+
+def function_identity(func) -> str:
+    module = sys.modules.get(func.__module__)
+    path = getattr(module, '__file__', None)
+    return os.path.realpath(path) if path else func.__module__
+
+def stable_key(func, args: tuple, kwargs: dict) -> bytes:
+    identity = (function_identity(func), func.__qualname__, canonical(args), canonical(kwargs))
+    return hashlib.sha256(pickle.dumps(identity, protocol=PICKLE_PROTOCOL)).digest()
+
+class DiskCache:
+    def __init__(self, path: str, max_entries: Optional[int] = 10_000, max_bytes: Optional[int] = 256 * 1024 * 1024,
+                 ttl: Optional[float] = None):
+        if max_entries is not None and max_entries < 0:
+            raise ValueError(f"max_entries must be None or >= 0, got {max_entries}")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError(f"max_bytes must be None or >= 0, got {max_bytes}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be None or > 0, got {ttl}")
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.executescript(SCHEMA)
+            self._connection, self._pid = connection, os.getpid()
+        return self._connection
+
+    def get(self, key: bytes) -> Tuple[bool, Any]:
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute('SELECT value, created FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return False, None
+            value, created = row
+            if self.ttl is not None and created + self.ttl <= now:
+                connection.execute('DELETE FROM entries WHERE key = ?', (key,))
+                return False, None
+            connection.execute('UPDATE entries SET accessed = ? WHERE key = ?', (now, key))
+        try:
+            return True, pickle.loads(value)
+        except UNPICKLE_ERRORS:
+            with self._lock:
+                self._connect().execute('DELETE FROM entries WHERE key = ?', (key,))
+            return False, None
+
+    def put(self, key: bytes, value: Any) -> bool:
+        try:
+            blob = pickle.dumps(value, protocol=PICKLE_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+        if self.max_entries == 0 or (self.max_bytes is not None and len(blob) > self.max_bytes):
+            return False
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                connection.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)',
+                                   (key, blob, len(blob), now, now))
+                self._evict(connection)
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+        return True
+
+    def _evict(self, connection: sqlite3.Connection):
+        count, size = connection.execute('SELECT COUNT(*), TOTAL(size) FROM entries').fetchone()
+        excess_entries = count - self.max_entries if self.max_entries is not None else 0
+        excess_bytes = size - self.max_bytes if self.max_bytes is not None else 0
+        if excess_entries <= 0 and excess_bytes <= 0:
+            return
+        victims = []
+        for key, entry_size in connection.execute('SELECT key, size FROM entries ORDER BY accessed'):
+            if excess_entries <= 0 and excess_bytes <= 0:
+                break
+            victims.append((key,))
+            excess_entries -= 1
+            excess_bytes -= entry_size
+        connection.executemany('DELETE FROM entries WHERE key = ?', victims)
+
+    def __len__(self):
+        with self._lock:
+            return self._connect().execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._connect().execute('DELETE FROM entries')
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
@@ -0,0 +1,130 @@
+import argparse
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from cipher import encrypt_bytes
+
+CHUNK_SIZE = 1024 * 1024
+
+def iter_chunks(stream: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    while chunk := stream.read(chunk_size):
+        yield chunk
+
+def cipher_stream(source: BinaryIO, target: BinaryIO, key: int, chunk_size: int = CHUNK_SIZE) -> int:
+    written = 0
+    for chunk in iter_chunks(source, chunk_size):
+        written += target.write(encrypt_bytes(chunk, key))
+    return written
+
+def byte_ranges(size: int, workers: int, chunk_size: int = CHUNK_SIZE) -> List[Tuple[int, int]]:
+    step = max(chunk_size, -(-size // max(workers, 1)))
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+def cipher_range(source_path: str, target_path: str, key: int, start: int, end: int,
+                 chunk_size: int = CHUNK_SIZE) -> int:
+    source = os.open(source_path, os.O_RDONLY)
+    try:
+        target = os.open(target_path, os.O_WRONLY)
+        try:
+            offset = start
+            while offset < end:
+                chunk = os.pread(source, min(chunk_size, end - offset), offset)
+                if not chunk:
+                    break
+                os.pwrite(target, encrypt_bytes(chunk, key), offset)
+                offset += len(chunk)
+            return offset - start
+        finally:
+            os.close(target)
+    finally:
+        os.close(source)
+
+def cipher_mmap(source_path: str, target_path: str, key: int, chunk_size: int = CHUNK_SIZE) -> int:
+    size = os.path.getsize(source_path)
+    with open(source_path, 'rb') as source, open(target_path, 'w+b') as target:
+        if not size:
+            return 0
+        target.truncate(size)
+        step = -(-chunk_size // mmap.ALLOCATIONGRANULARITY) * mmap.ALLOCATIONGRANULARITY
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as src, \
+                mmap.mmap(target.fileno(), size) as dst:
+            for offset in range(0, size, step):
+                length = min(step, size - offset)
+                dst[offset:offset + length] = encrypt_bytes(src[offset:offset + length], key)
+                dst.flush(offset, length)
+                if hasattr(mmap, 'MADV_DONTNEED'):
+                    src.madvise(mmap.MADV_DONTNEED, offset, length)
+                    dst.madvise(mmap.MADV_DONTNEED, offset, length)
+    return size
+
+def cipher_file(source_path: str, target_path: str, key: int, chunk_size: int = CHUNK_SIZE,
+                workers: int = 1, use_mmap: bool = False) -> int:
+    if os.path.exists(target_path) and os.path.samefile(source_path, target_path):
+        raise ValueError(f"Input and output are the same file: {source_path}")
+
+    if use_mmap:
+        return cipher_mmap(source_path, target_path, key, chunk_size)
+
+    if workers <= 1:
+        with open(source_path, 'rb') as source, open(target_path, 'wb') as target:
+            return cipher_stream(source, target, key, chunk_size)
+
+    size = os.path.getsize(source_path)
+    with open(target_path, 'wb') as target:
+        target.truncate(size)
+    ranges = byte_ranges(size, workers, chunk_size)
+    if len(ranges) <= 1:
+        return sum(cipher_range(source_path, target_path, key, start, end, chunk_size) for start, end in ranges)
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+        futures = [executor.submit(cipher_range, source_path, target_path, key, start, end, chunk_size)
+                   for start, end in ranges]
+        return sum(future.result() for future in futures)
+
+def encrypt_file(source_path: str, target_path: str, key: int, chunk_size: int = CHUNK_SIZE,
+                 workers: int = 1, use_mmap: bool = False) -> int:
+    return cipher_file(source_path, target_path, key, chunk_size, workers, use_mmap)
+
+def decrypt_file(source_path: str, target_path: str, key: int, chunk_size: int = CHUNK_SIZE,
+                 workers: int = 1, use_mmap: bool = False) -> int:
+    return cipher_file(source_path, target_path, -key, chunk_size, workers, use_mmap)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Encrypt or decrypt a file with the Caesar cipher, in constant memory")
+    parser.add_argument('mode', choices=['encrypt', 'decrypt'])
+    parser.add_argument('key', type=int)
+    parser.add_argument('input', help="file to read, or - for stdin")
+    parser.add_argument('-o', '--output', default='-', help="file to write, or - for stdout (default)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help=f"bytes per chunk (default {CHUNK_SIZE})")
+    parser.add_argument('--workers', type=int, default=1, help="split the file into byte ranges across N processes")
+    parser.add_argument('--mmap', action='store_true', help="memory-map input and output instead of reading chunks")
+    args = parser.parse_args(argv)
+
+    if args.chunk_size <= 0:
+        parser.error("--chunk-size must be positive")
+    key = args.key if args.mode == 'encrypt' else -args.key
+
+    if args.input == '-' or args.output == '-':
+        if args.workers > 1 or args.mmap:
+            parser.error("--workers and --mmap need regular files for input and output")
+        source = sys.stdin.buffer if args.input == '-' else open(args.input, 'rb')
+        target = sys.stdout.buffer if args.output == '-' else open(args.output, 'wb')
+        try:
+            cipher_stream(source, target, key, args.chunk_size)
+        finally:
+            if source is not sys.stdin.buffer:
+                source.close()
+            if target is not sys.stdout.buffer:
+                target.close()
+        return
+
+    try:
+        cipher_file(args.input, args.output, key, args.chunk_size, args.workers, args.mmap)
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"Error: {e}\n")
+
+if __name__ == '__main__':
+    main()